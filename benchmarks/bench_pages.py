@@ -0,0 +1,134 @@
+"""Page-level benchmark for the PTS Data Platform.
+
+Drives every role's pages headlessly with AppTest on synthetic cohorts and
+records rerun latency and peak memory:
+
+    python benchmarks/bench_pages.py --sizes 1000 10000 100000
+    python benchmarks/bench_pages.py --output results.jsonl --compare baseline.jsonl
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from pts.store import StudentStore
+from pts.synthetic import build_store
+
+APP = os.path.join(ROOT, 'streamlit_app.py')
+
+# Logged-in session state for each role, as authenticate() would set it
+ROLES = {
+    'admin': {'user': 'admin', 'role': 'admin', 'user_name': 'System Administrator'},
+    'teacher': {'user': 'teacher', 'role': 'teacher', 'user_name': 'Teacher'},
+    'coordinator': {'user': 'coordinator', 'role': 'coordinator', 'user_name': 'Center Coordinator'}
+}
+
+
+def open_session(role, timeout):
+    at = AppTest.from_file(APP, default_timeout=timeout)
+    at.session_state['authenticated'] = True
+    for key, value in ROLES[role].items():
+        at.session_state[key] = value
+    at.run()
+    return at
+
+
+def page_selector(at):
+    return next(s for s in at.sidebar.selectbox if s.label == "Select Page")
+
+
+def bench_page(role, page, repeat, timeout):
+    """Rerun latencies (ms) and peak traced allocation (MB) for one role's page."""
+    at = open_session(role, timeout)
+    page_selector(at).set_value(page)
+
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        at.run()
+        latencies.append((time.perf_counter() - start) * 1000)
+    if at.exception:
+        raise RuntimeError(f"{role} / {page}: {at.exception[0].value}")
+
+    # Memory is measured on a separate run; tracing slows everything down
+    tracemalloc.start()
+    at.run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return latencies, peak / 2**20
+
+
+def run(sizes, repeat, timeout):
+    results = []
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as data_dir:
+            os.environ['PTS_DATA_DIR'] = data_dir
+            build_store(size)
+
+            start = time.perf_counter()
+            StudentStore()
+            cold_start = (time.perf_counter() - start) * 1000
+            print(f"\n{size:,} students - cold start {cold_start:.0f} ms")
+
+            # Every size starts from an empty cache so the app loads this size's file
+            st.cache_resource.clear()
+            for role in ROLES:
+                for page in page_selector(open_session(role, timeout)).options:
+                    latencies, peak_mb = bench_page(role, page, repeat, timeout)
+                    result = {
+                        'students': size, 'role': role, 'page': page,
+                        'p50_ms': round(statistics.median(latencies), 1),
+                        'max_ms': round(max(latencies), 1),
+                        'peak_mb': round(peak_mb, 1)
+                    }
+                    results.append(result)
+                    print(f"  {role:<12} {page:<24} p50 {result['p50_ms']:>8.1f} ms"
+                          f"   max {result['max_ms']:>8.1f} ms   peak {result['peak_mb']:>7.1f} MB")
+    return results
+
+
+def compare(results, baseline_path, tolerance):
+    """Print pages whose median got more than ``tolerance`` slower than the baseline; return how many."""
+    with open(baseline_path) as f:
+        baseline = {(r['students'], r['role'], r['page']): r for r in map(json.loads, f)}
+    regressions = 0
+    for result in results:
+        before = baseline.get((result['students'], result['role'], result['page']))
+        if before and result['p50_ms'] > before['p50_ms'] * (1 + tolerance):
+            regressions += 1
+            print(f"REGRESSION {result['students']:,} {result['role']} / {result['page']}: "
+                  f"{before['p50_ms']} ms -> {result['p50_ms']} ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    parser.add_argument('--repeat', type=int, default=5, help="reruns timed per page")
+    parser.add_argument('--timeout', type=float, default=120, help="seconds allowed per script run")
+    parser.add_argument('--output', help="write results as JSON lines")
+    parser.add_argument('--compare', help="earlier --output file to check for regressions")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed slowdown vs --compare")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.repeat, args.timeout)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.writelines(json.dumps(result) + '\n' for result in results)
+    if args.compare and compare(results, args.compare, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,330 @@
+"""Concurrent-session load test for the PTS Data Platform.
+
+Runs many simulated sessions at once against a synthetic cohort. Each
+session logs in through the login form in ``streamlit_app.py`` and then
+loops through its role's flow: dashboards, Data Entry saves, approvals,
+adding students and report generation. Reports throughput and p50/p99 rerun
+latency per role and per step, and exits non-zero when a role misses its SLO:
+
+    python benchmarks/load_test.py --students 10000 --sessions admin=2 teacher=8 coordinator=4
+    python benchmarks/load_test.py --processes 4 --duration 120 --slo teacher=300:1500 --output load.jsonl
+
+Sessions are threads inside server processes (``--processes``) that share
+the store files as a multi-process deployment would. AppTest can run only
+one script at a time per process, so sessions in the same process take turns
+and the latency recorded includes the wait. By default every session gets
+its own process, so reruns really run at the same time; when sessions have
+to share (a smaller ``--processes``), the summary says so, because the SLO
+results then measure queueing as much as contention.
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from streamlit.testing.v1 import AppTest
+
+from pts import reports
+from pts.store import CENTERS
+from pts.synthetic import build_store
+
+APP = os.path.join(ROOT, 'streamlit_app.py')
+
+# The demo logins authenticate() accepts
+CREDENTIALS = {
+    'admin': ('admin', 'admin123'),
+    'teacher': ('teacher', 'teacher123'),
+    'coordinator': ('coordinator', 'coord123')
+}
+
+# role -> (p50 ms, p99 ms) every rerun of that role's sessions must stay under
+DEFAULT_SLOS = {
+    'admin': (1000, 5000),
+    'teacher': (500, 2000),
+    'coordinator': (500, 2000)
+}
+
+DEFAULT_SESSIONS = {'admin': 2, 'teacher': 6, 'coordinator': 4}
+
+# One script run at a time per process; see the module docstring
+_RUN_LOCK = threading.Lock()
+
+
+class Session:
+    """One simulated user: an AppTest driven through the app's widgets, timing every rerun."""
+
+    def __init__(self, role, timeout, record, class_size=0):
+        self.role = role
+        self.class_size = class_size
+        self.at = AppTest.from_file(APP, default_timeout=timeout)
+        self._record = record
+
+    def timed(self, step, action):
+        """Run ``action`` (which ends in a script run) and record its latency under ``step``."""
+        start = time.perf_counter()
+        with _RUN_LOCK:
+            action()
+        elapsed = (time.perf_counter() - start) * 1000
+        error = str(self.at.exception[0].value) if self.at.exception else None
+        self._record(self.role, step, elapsed, error)
+
+    def login(self):
+        self.timed('open', self.at.run)
+        username, password = CREDENTIALS[self.role]
+        self.widget('text_input', 'Username').input(username)
+        self.widget('text_input', 'Password').input(password)
+        self.timed('login', self.widget('button', 'Login').click().run)
+
+    def widget(self, kind, label):
+        return next(w for w in getattr(self.at, kind) if w.label == label)
+
+    def open_page(self, page):
+        selector = next(s for s in self.at.sidebar.selectbox if s.label == "Select Page")
+        if selector.value != page:
+            self.timed(f"open {page}", selector.set_value(page).run)
+
+    # Flows: one pass through what a user of each role typically does
+
+    def admin(self):
+        self.open_page("Dashboard Overview")
+        self.timed("center details", self.widget('selectbox', "View Center Details:").set_value(random.choice(CENTERS)).run)
+
+        self.open_page("Scholarship Approvals")
+        approve = [b for b in self.at.button if (b.key or '').startswith('approve_')]
+        if approve:
+            self.timed("approve", random.choice(approve).click().run)
+        else:
+            self.timed("approvals", self.at.run)
+
+        self.generate_report()
+
+    def teacher(self):
+        self.open_page("Dashboard Overview")
+        self.timed("dashboard", self.at.run)
+
+        self.open_page("Data Entry")
+        period = self.widget('selectbox', "Assessment Period").value
+        if self.class_size:
+            # The edit a teacher makes in the grid, as st.data_editor reports it
+            self.at.session_state[f"assessment_grid_{period}"] = {
+                'edited_rows': {random.randrange(self.class_size): {'Math': random.randint(40, 100)}},
+                'added_rows': [], 'deleted_rows': []
+            }
+        self.timed("save scores", self.widget('button', "💾 Save Assessment Data").click().run)
+
+    def coordinator(self):
+        self.open_page("Dashboard Overview")
+        self.timed("dashboard", self.at.run)
+
+        self.open_page("Add New Student")
+        self.widget('text_input', "Student Name *").input(f"Load Test {random.randrange(10**6)}")
+        self.timed("add student", self.widget('button', "✅ Add Student to Program").click().run)
+
+        self.generate_report()
+
+    def generate_report(self):
+        self.open_page("Reports & Analytics")
+        self.widget('selectbox', "Report Type").set_value(random.choice(list(reports.REPORTS)))
+        self.widget('selectbox', "Grade Filter").set_value(random.choice(list(reports.GRADE_FILTERS)))
+        self.timed("generate report", self.widget('button', "🚀 Generate Report").click().run)
+
+
+class Recorder:
+    """Latencies and errors from every session, safe to add to from many threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(list)
+
+    def __call__(self, role, step, ms, error):
+        with self._lock:
+            self.latencies[role, step].append(ms)
+            if error:
+                self.errors[role, step].append(error)
+
+
+def percentile(values, q):
+    """The ``q``-th percentile (0-100) of ``values``."""
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method='inclusive')[q - 1]
+
+
+def summarize(latencies, wall_seconds):
+    """One row per role (step ``*``) and per (role, step): reruns, throughput and p50/p99."""
+    by_role = defaultdict(list)
+    for (role, step), values in latencies.items():
+        by_role[role, '*'] += values
+    rows = []
+    for (role, step), values in sorted({**by_role, **latencies}.items()):
+        rows.append({
+            'role': role, 'step': step, 'reruns': len(values),
+            'per_second': round(len(values) / wall_seconds, 2),
+            'p50_ms': round(percentile(values, 50), 1),
+            'p99_ms': round(percentile(values, 99), 1),
+            'max_ms': round(max(values), 1)
+        })
+    return rows
+
+
+def simulate(role, timeout, recorder, deadline, think, class_size):
+    session = Session(role, timeout, recorder, class_size)
+    session.login()
+    flow = getattr(session, role)
+    while time.monotonic() < deadline:
+        flow()
+        if think:
+            time.sleep(random.uniform(0, 2 * think))
+
+
+def serve(data_dir, sessions, duration, think, timeout, seed, class_size):
+    """One server process: run ``sessions`` (role -> count) until ``duration`` is up; return what they recorded."""
+    os.environ['PTS_DATA_DIR'] = data_dir
+    random.seed(seed)
+
+    # The first session pays the store's cold start; it is not part of the test
+    Session('admin', timeout, lambda *args: None).login()
+
+    recorder = Recorder()
+    deadline = time.monotonic() + duration
+    threads = [
+        threading.Thread(
+            target=simulate, name=f"{role}-{i}",
+            args=(role, timeout, recorder, deadline, think, class_size if role == 'teacher' else 0)
+        )
+        for role, count in sessions.items() for i in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return dict(recorder.latencies), dict(recorder.errors)
+
+
+def split(sessions, processes):
+    """Deal each role's sessions across ``processes`` as evenly as possible."""
+    shares = [defaultdict(int) for _ in range(processes)]
+    slot = 0
+    for role, count in sessions.items():
+        for _ in range(count):
+            shares[slot % processes][role] += 1
+            slot += 1
+    return [dict(share) for share in shares if share]
+
+
+def run(students, sessions, processes, duration, think, timeout, seed):
+    with tempfile.TemporaryDirectory() as data_dir:
+        os.environ['PTS_DATA_DIR'] = data_dir
+        # Data Entry shows Teacher A's class
+        class_size = len(build_store(students).ids(teacher_assigned='Teacher A'))
+
+        shares = split(sessions, processes)
+        recorder = Recorder()
+        start = time.perf_counter()
+        with ProcessPoolExecutor(len(shares), mp_context=get_context('spawn')) as pool:
+            futures = [
+                pool.submit(serve, data_dir, share, duration, think, timeout, seed + i, class_size)
+                for i, share in enumerate(shares)
+            ]
+            for future in futures:
+                latencies, errors = future.result()
+                for key, values in latencies.items():
+                    recorder.latencies[key] += values
+                for key, messages in errors.items():
+                    recorder.errors[key] += messages
+        wall = time.perf_counter() - start
+    return summarize(recorder.latencies, wall), recorder.errors, wall
+
+
+def check_slos(rows, slos):
+    """Print each role's result against its SLO; return the roles that missed it."""
+    missed = []
+    for row in rows:
+        if row['step'] != '*' or row['role'] not in slos:
+            continue
+        p50, p99 = slos[row['role']]
+        ok = row['p50_ms'] <= p50 and row['p99_ms'] <= p99
+        if not ok:
+            missed.append(row['role'])
+        print(f"{'PASS' if ok else 'FAIL'} {row['role']:<12} p50 {row['p50_ms']:>8.1f} / {p50} ms"
+              f"   p99 {row['p99_ms']:>8.1f} / {p99} ms   {row['per_second']:.2f} reruns/s")
+    return missed
+
+
+def _role_counts(values):
+    counts = {}
+    for value in values:
+        role, _, count = value.partition('=')
+        if role not in CREDENTIALS:
+            raise argparse.ArgumentTypeError(f"unknown role {role!r}")
+        counts[role] = count
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--students', type=int, default=10_000)
+    parser.add_argument('--sessions', nargs='+', default=[], metavar='ROLE=N',
+                        help=f"concurrent sessions per role (default {DEFAULT_SESSIONS})")
+    parser.add_argument('--processes', type=int, default=None,
+                        help="server processes sharing the store (default: one per session)")
+    parser.add_argument('--duration', type=float, default=60, help="seconds to keep starting new flows")
+    parser.add_argument('--think', type=float, default=0.5, help="mean seconds a user pauses between flows")
+    parser.add_argument('--slo', nargs='+', default=[], metavar='ROLE=P50:P99',
+                        help=f"latency targets in ms (default {DEFAULT_SLOS})")
+    parser.add_argument('--timeout', type=float, default=120, help="seconds allowed per script run")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="write the per-role and per-step results as JSON lines")
+    args = parser.parse_args()
+
+    sessions = {**DEFAULT_SESSIONS, **{role: int(n) for role, n in _role_counts(args.sessions).items()}}
+    slos = {**DEFAULT_SLOS, **{
+        role: tuple(float(ms) for ms in target.split(':')) for role, target in _role_counts(args.slo).items()
+    }}
+
+    processes = args.processes or sum(sessions.values())
+    per_process = max(sum(share.values()) for share in split(sessions, processes))
+
+    print(f"{sum(sessions.values())} sessions {sessions} in {processes} process(es) "
+          f"on {args.students:,} students for {args.duration:.0f} s")
+    rows, errors, wall = run(
+        args.students, sessions, processes, args.duration, args.think, args.timeout, args.seed
+    )
+
+    print(f"\n{'role':<12} {'step':<32} {'reruns':>7} {'/s':>7} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    for row in rows:
+        print(f"{row['role']:<12} {row['step']:<32} {row['reruns']:>7} {row['per_second']:>7.2f} "
+              f"{row['p50_ms']:>9.1f} {row['p99_ms']:>9.1f} {row['max_ms']:>9.1f}")
+    for (role, step), messages in sorted(errors.items()):
+        print(f"ERRORS {role} / {step}: {len(messages)}, e.g. {messages[0]}")
+    print(f"\nTotal {sum(row['reruns'] for row in rows if row['step'] == '*')} reruns in {wall:.1f} s")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.writelines(
+                json.dumps({'students': args.students, 'sessions_per_process': per_process, **row}) + '\n'
+                for row in rows
+            )
+    if per_process > 1:
+        print(f"\nWARNING: up to {per_process} sessions share a process and run one at a time, so these "
+              f"latencies include queueing for it; they are not concurrent capacity. "
+              f"Use --processes {sum(sessions.values())} for one session per process.")
+    if check_slos(rows, slos) or errors:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
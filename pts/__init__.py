@@ -0,0 +1,2 @@
+# pts/__init__.py
+# Shared data layer for the PTS Data Platform
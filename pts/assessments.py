@@ -0,0 +1,223 @@
+# pts/assessments.py
+# Scores in long format, one entry per (student_id, period, subject)
+
+import numpy as np
+import pandas as pd
+
+# Student-table columns that hold an assessment, and the (period, subject) each one is
+WIDE_COLUMNS = {
+    'mid_year_math': ('Mid-Year', 'Math'),
+    'mid_year_english': ('Mid-Year', 'English'),
+    'mid_year_science': ('Mid-Year', 'Science'),
+    'attendance_mid': ('Mid-Year', 'Attendance'),
+    'end_year_math': ('End-Year', 'Math'),
+    'end_year_english': ('End-Year', 'English'),
+    'end_year_science': ('End-Year', 'Science'),
+    'attendance_end': ('End-Year', 'Attendance')
+}
+LONG_COLUMNS = ['student_id', 'period', 'subject', 'score']
+
+# Inclusive bounds of a score; each is kept in one byte
+SCORE_RANGE = (0, 100)
+
+# Bits of the packed key given to period and subject codes (so up to 256 of each)
+_CODE_BITS = 8
+
+
+def from_wide(data, columns=None):
+    """Long rows for the ``WIDE_COLUMNS`` in ``data`` (or just ``columns``); empty cells have an NA score."""
+    columns = [column for column in (columns or WIDE_COLUMNS) if column in data]
+    n = len(data)
+    return pd.DataFrame({
+        'student_id': np.tile(data.index.to_numpy(dtype='int64'), len(columns)),
+        'period': np.repeat([WIDE_COLUMNS[column][0] for column in columns], n),
+        'subject': np.repeat([WIDE_COLUMNS[column][1] for column in columns], n),
+        'score': np.concatenate([data[column].to_numpy(dtype='float64', na_value=np.nan) for column in columns]) if columns else []
+    })
+
+
+def check(rows):
+    """Raise ``ValueError`` unless every score in ``rows`` is NA or a whole number within ``SCORE_RANGE``."""
+    scores = rows['score'].to_numpy(dtype='float64', na_value=np.nan)
+    low, high = SCORE_RANGE
+    bad = ~np.isnan(scores) & ((scores < low) | (scores > high) | (scores % 1 != 0))
+    if bad.any():
+        raise ValueError(f"Scores must be whole numbers from {low} to {high}, not {sorted(set(scores[bad].tolist()))}")
+
+
+def wide_column(rows):
+    """The student-table column each long row maps to, or NA for periods/subjects without one."""
+    lookup = {pair: column for column, pair in WIDE_COLUMNS.items()}
+    return pd.Series([lookup.get(pair) for pair in zip(rows['period'], rows['subject'])], index=rows.index, dtype=object)
+
+
+def records(rows):
+    """``rows`` as plain ``[student_id, period, subject, score]`` lists, NA scores as ``None``."""
+    scores = rows['score'].astype('float64')
+    return [
+        [int(sid), period, subject, None if np.isnan(score) else int(score)]
+        for sid, period, subject, score in zip(rows['student_id'], rows['period'], rows['subject'], scores)
+    ]
+
+
+class AssessmentTable:
+    """Every recorded score, stored as a sorted array of packed keys and a byte per score.
+
+    A key packs ``student_id``, a period code and a subject code into one
+    int64, so a batch of upserts is a ``searchsorted`` and a pivot is a
+    scatter into a matrix, with no per-row Python work and no copy of the
+    student table. Periods and subjects are registered the first time they
+    are recorded; periods keep that order, so record them chronologically.
+
+    Writes build new arrays and swap them in, as the student store does, so
+    readers never see a half-applied batch. As a store listener it mirrors
+    the ``WIDE_COLUMNS`` of the student table.
+    """
+
+    def __init__(self):
+        # The student table's periods and subjects come first
+        self.periods = list(dict.fromkeys(period for period, _ in WIDE_COLUMNS.values()))
+        self.subjects = list(dict.fromkeys(subject for _, subject in WIDE_COLUMNS.values()))
+        self.version = 0
+        self._entries = (np.empty(0, dtype='int64'), np.empty(0, dtype='uint8'))
+        self._summary = None
+
+    def _codes(self, labels, registry):
+        labels = pd.Series(labels, dtype=object)
+        for label in pd.unique(labels):
+            if label not in registry:
+                if len(registry) >= 1 << _CODE_BITS:
+                    raise ValueError(f"Too many distinct values to record {label!r}")
+                registry.append(label)
+        return labels.map({label: code for code, label in enumerate(registry)}).to_numpy(dtype='int64')
+
+    def _unpack(self, keys):
+        mask = (1 << _CODE_BITS) - 1
+        return keys >> (2 * _CODE_BITS), (keys >> _CODE_BITS) & mask, keys & mask
+
+    def __len__(self):
+        return len(self._entries[0])
+
+    # Writes
+
+    def record(self, rows):
+        """Upsert long ``rows``; an NA score removes that entry. Within a batch the last row wins.
+
+        Raises ``ValueError`` (see ``check()``), recording nothing, if any score does not fit.
+        """
+        if not len(rows):
+            return
+        check(rows)
+        keys = (
+            (rows['student_id'].to_numpy(dtype='int64') << (2 * _CODE_BITS))
+            | (self._codes(rows['period'], self.periods) << _CODE_BITS)
+            | self._codes(rows['subject'], self.subjects)
+        )
+        scores = rows['score'].to_numpy(dtype='float64', na_value=np.nan)
+        keys, last = np.unique(keys[::-1], return_index=True)
+        scores = scores[::-1][last]
+
+        old_keys, old_scores = self._entries
+        at = np.searchsorted(old_keys, keys)
+        found = at < len(old_keys)
+        found[found] = old_keys[at[found]] == keys[found]
+        present = ~np.isnan(scores)
+
+        new_scores = old_scores.copy()
+        new_scores[at[found & present]] = scores[found & present]
+        removed = at[found & ~present]
+        new_keys, new_scores = np.delete(old_keys, removed), np.delete(new_scores, removed)
+        added = ~found & present
+        at = np.searchsorted(new_keys, keys[added])
+        self._entries = (np.insert(new_keys, at, keys[added]), np.insert(new_scores, at, scores[added].astype('uint8')))
+        self.version += 1
+
+    def rebuild(self, data):
+        self.record(from_wide(data))
+
+    def apply(self, before, after):
+        if after is None:
+            return
+        # Only the wide columns this write actually changed
+        columns = [
+            column for column in WIDE_COLUMNS
+            if column in after and (before is None or not before[column].equals(after[column]))
+        ]
+        if columns:
+            self.record(from_wide(after, columns))
+
+    # Reads
+
+    def _select(self, period=None, student_ids=None):
+        keys, scores = self._entries
+        if student_ids is not None:
+            # Keys sort by student first, so each student's entries are one contiguous run
+            ids = np.unique(np.asarray(student_ids, dtype='int64'))
+            start = np.searchsorted(keys, ids << (2 * _CODE_BITS))
+            lengths = np.searchsorted(keys, (ids + 1) << (2 * _CODE_BITS)) - start
+            at = np.repeat(start - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+            keys, scores = keys[at], scores[at]
+        sids, periods, subjects = self._unpack(keys)
+        if period is not None:
+            mask = periods == (self.periods.index(period) if period in self.periods else -1)
+            sids, periods, subjects, scores = sids[mask], periods[mask], subjects[mask], scores[mask]
+        return sids, periods, subjects, scores
+
+    def frame(self, period=None, student_ids=None):
+        """Long rows, optionally for one ``period`` and/or some ``student_ids``."""
+        sids, periods, subjects, scores = self._select(period, student_ids)
+        return pd.DataFrame({
+            'student_id': sids,
+            'period': pd.Categorical.from_codes(periods, categories=list(self.periods)),
+            'subject': pd.Categorical.from_codes(subjects, categories=list(self.subjects)),
+            'score': scores
+        })
+
+    def subjects_in(self, period):
+        """Subjects with at least one score recorded in ``period``, in registration order."""
+        _, _, subjects, _ = self._select(period)
+        return [self.subjects[code] for code in np.unique(subjects)]
+
+    def pivot(self, period=None, student_ids=None):
+        """Scores as a wide table indexed by ``student_id``.
+
+        For one ``period`` the columns are its subjects; otherwise they are
+        (period, subject) pairs. Given ``student_ids``, rows follow that order
+        and students with nothing recorded get an empty row.
+        """
+        sids, periods, subjects, scores = self._select(period, student_ids)
+        if period is None:
+            column_codes = (periods << _CODE_BITS) | subjects
+        else:
+            column_codes = subjects
+        columns, column_at = np.unique(column_codes, return_inverse=True)
+        rows, row_at = np.unique(sids, return_inverse=True)
+        matrix = np.full((len(rows), len(columns)), np.nan)
+        matrix[row_at, column_at] = scores
+        if period is None:
+            labels = pd.MultiIndex.from_tuples(
+                [(self.periods[code >> _CODE_BITS], self.subjects[code & ((1 << _CODE_BITS) - 1)]) for code in columns],
+                names=['period', 'subject']
+            )
+        else:
+            labels = pd.Index([self.subjects[code] for code in columns], name='subject')
+        table = pd.DataFrame(matrix, index=pd.Index(rows, name='student_id'), columns=labels)
+        return table if student_ids is None else table.reindex(pd.Index(student_ids, name='student_id'))
+
+    def summary(self):
+        """Students assessed and mean score for every (period, subject), cached until the next write."""
+        if self._summary is None or self._summary[0] != self.version:
+            version = self.version
+            keys, scores = self._entries
+            _, periods, subjects = self._unpack(keys)
+            groups = (periods << _CODE_BITS) | subjects
+            codes, at = np.unique(groups, return_inverse=True)
+            students = np.bincount(at, minlength=len(codes))
+            totals = np.bincount(at, weights=scores, minlength=len(codes))
+            index = pd.MultiIndex.from_arrays([
+                pd.Categorical.from_codes(codes >> _CODE_BITS, categories=list(self.periods)),
+                pd.Categorical.from_codes(codes & ((1 << _CODE_BITS) - 1), categories=list(self.subjects))
+            ], names=['period', 'subject'])
+            table = pd.DataFrame({'students': students, 'mean': totals / np.maximum(students, 1)}, index=index)
+            self._summary = (version, table)
+        return self._summary[1]
@@ -0,0 +1,31 @@
+# pts/cache.py
+# Results cached against the store's data version
+
+import functools
+import threading
+
+
+def per_version(fn):
+    """Cache ``fn(store, *args)`` until ``store.version`` changes.
+
+    Only the current version's results are kept, so the cache never holds
+    more than one generation of answers.
+    """
+    state = {'key': None, 'results': {}}
+    lock = threading.Lock()
+
+    @functools.wraps(fn)
+    def wrapper(store, *args):
+        generation = (id(store), store.version)
+        with lock:
+            if state['key'] != generation:
+                state['key'], state['results'] = generation, {}
+            if args in state['results']:
+                return state['results'][args]
+        result = fn(store, *args)
+        with lock:
+            if state['key'] == generation:
+                state['results'][args] = result
+        return result
+
+    return wrapper
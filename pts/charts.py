@@ -0,0 +1,93 @@
+# pts/charts.py
+# Live Analytics charts built from server-side bins, so the figure sent to the
+# browser has a fixed number of points however many students there are
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from pts.cache import per_version
+
+# 0-100 in 5-point bins for attendance and scores
+BIN_EDGES = np.linspace(0, 100, 21)
+
+
+def _histogram(values):
+    values = values.dropna().to_numpy(dtype=float)
+    counts, edges = np.histogram(values, bins=BIN_EDGES)
+    return pd.DataFrame({'low': edges[:-1], 'high': edges[1:], 'students': counts})
+
+
+@per_version
+def distributions(store):
+    """Binned counts of attendance and mid/end-year averages."""
+    data = store.frame()
+    return {
+        column: _histogram(data[column])
+        for column in ['attendance_avg', 'mid_year_avg', 'end_year_avg']
+    }
+
+
+@per_version
+def attendance_vs_score(store):
+    """Students per (attendance bin, end-year average bin), non-empty cells only."""
+    data = store.frame()[['attendance_avg', 'end_year_avg']].dropna()
+    counts, x_edges, y_edges = np.histogram2d(
+        data['attendance_avg'].to_numpy(dtype=float), data['end_year_avg'].to_numpy(dtype=float),
+        bins=[BIN_EDGES, BIN_EDGES]
+    )
+    x, y = np.nonzero(counts)
+    return pd.DataFrame({
+        'attendance': (x_edges[x] + x_edges[x + 1]) / 2,
+        'end_year_avg': (y_edges[y] + y_edges[y + 1]) / 2,
+        'students': counts[x, y].astype(int)
+    })
+
+
+def _bar_layout(fig, x_title):
+    fig.update_layout(
+        bargap=0.05, height=320, margin=dict(l=10, r=10, t=10, b=10),
+        xaxis_title=x_title, yaxis_title="Students"
+    )
+    return fig
+
+
+def attendance_figure(store):
+    bins = distributions(store)['attendance_avg']
+    fig = go.Figure(go.Bar(
+        x=(bins['low'] + bins['high']) / 2, y=bins['students'], width=5,
+        customdata=bins[['low', 'high']], hovertemplate="%{customdata[0]:.0f}-%{customdata[1]:.0f}%: %{y}<extra></extra>"
+    ))
+    return _bar_layout(fig, "Average attendance %")
+
+
+def scores_figure(store):
+    fig = go.Figure()
+    for column, label in [('mid_year_avg', 'Mid-Year'), ('end_year_avg', 'End-Year')]:
+        bins = distributions(store)[column]
+        fig.add_trace(go.Bar(x=(bins['low'] + bins['high']) / 2, y=bins['students'], width=5, name=label, opacity=0.7))
+    fig.update_layout(barmode='overlay')
+    return _bar_layout(fig, "Average score %")
+
+
+def status_figure(store):
+    counts = store.rollup('status')['students']
+    fig = go.Figure(go.Bar(x=counts.index.astype(str), y=counts.to_numpy()))
+    return _bar_layout(fig, "Scholarship status")
+
+
+def attendance_vs_score_figure(store):
+    # WebGL scatter of the occupied 2D bins, sized by how many students fall in each
+    cells = attendance_vs_score(store)
+    sizes = 6 + 24 * np.sqrt(cells['students'] / max(cells['students'].max(), 1))
+    fig = go.Figure(go.Scattergl(
+        x=cells['attendance'], y=cells['end_year_avg'], mode='markers',
+        marker=dict(size=sizes, color=cells['students'], colorscale='Purples', showscale=True),
+        customdata=cells['students'], hovertemplate="%{customdata} students<extra></extra>"
+    ))
+    fig.update_layout(
+        height=320, margin=dict(l=10, r=10, t=10, b=10),
+        xaxis=dict(title="Average attendance %", range=[0, 100]),
+        yaxis=dict(title="End-year average %", range=[0, 100])
+    )
+    return fig
@@ -0,0 +1,168 @@
+# pts/cohort.py
+# Cohort analytics over the whole student table in one vectorized pass, cached per data version
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from pts.assessments import WIDE_COLUMNS
+from pts.cache import per_version
+
+# subject -> (mid-year column, end-year column)
+GROWTH_SUBJECTS = {
+    subject: tuple(column for column, (_, s) in WIDE_COLUMNS.items() if s == subject)
+    for subject in ['Math', 'English', 'Science']
+}
+
+# Each risk factor is scaled to 0 (no concern) .. 1 (full concern), then
+# weighted; a student missing a factor is scored on the ones they have
+RISK_WEIGHTS = {'attendance': 0.4, 'achievement': 0.3, 'decline': 0.2, 'entry': 0.1}
+RISK_FULL_ATTENDANCE_GAP = 25    # attendance of 75% or less is full concern
+RISK_FULL_DECLINE = 20           # a 20-point mid-to-end-year drop is full concern
+ENTRY_SCORE_MAX = 30
+
+# Risk score (0-100) lower bounds, highest band first
+RISK_BANDS = [('High', 50), ('Medium', 30)]
+DEFAULT_RISK_BAND = 'Low'
+
+# students: per-student measures; growth: mean growth per subject, overall and per center;
+# correlation: entry_score vs outcomes per grade; risk_counts: students per risk band
+CohortAnalytics = namedtuple('CohortAnalytics', ['students', 'growth', 'correlation', 'risk_counts'])
+
+
+def _floats(data, columns):
+    return data[columns].to_numpy(dtype='float64', na_value=np.nan)
+
+
+def growth(data):
+    """End-year minus mid-year score per subject, plus across subjects."""
+    mids = _floats(data, [mid for mid, _ in GROWTH_SUBJECTS.values()])
+    ends = _floats(data, [end for _, end in GROWTH_SUBJECTS.values()])
+    table = pd.DataFrame(ends - mids, index=data.index, columns=list(GROWTH_SUBJECTS))
+    table['Overall'] = data['end_year_avg'].astype('float64') - data['mid_year_avg'].astype('float64')
+    return table
+
+
+def latest_average(data):
+    """End-year average where entered, else mid-year."""
+    return data['end_year_avg'].astype('float64').fillna(data['mid_year_avg'].astype('float64'))
+
+
+def _run_starts(values):
+    # For each position of sorted ``values``, where its run of equal values starts and ends
+    new = np.ones(len(values), dtype=bool)
+    new[1:] = values[1:] != values[:-1]
+    starts = np.flatnonzero(new)
+    run = np.cumsum(new) - 1
+    return starts[run], np.r_[starts[1:], len(values)][run]
+
+
+def percentile_ranks(data, values):
+    """Percentile (0-100] of ``values`` among students of the same center and grade.
+
+    Ties share their average rank, as ``rank(pct=True)`` would give, but from
+    one sort of the whole table rather than a rank per group.
+    """
+    codes = pd.MultiIndex.from_arrays([data['center'], data['grade']]).codes
+    group = np.ravel_multi_index(codes, [int(c.max()) + 1 if len(c) else 1 for c in codes])
+    values = values.to_numpy(dtype='float64', na_value=np.nan)
+    # Scores are 0-100, so offsetting each group by 1000 sorts by group, then value;
+    # missing values sort last and are left out
+    order = np.argsort(group * 1000 + values)
+    order = order[:int((~np.isnan(values)).sum())]
+    first, last = _run_starts(values[order] + group[order] * 1000)
+    group_first, group_last = _run_starts(group[order])
+    percentile = np.full(len(values), np.nan)
+    percentile[order] = ((first - group_first) + (last - group_first) + 1) / 2 / (group_last - group_first) * 100
+    return pd.Series(percentile, index=data.index, name='percentile')
+
+
+def risk_scores(data, percentile, overall_growth):
+    """Composite 0-100 risk per student from ``RISK_WEIGHTS``."""
+    factors = np.column_stack([
+        np.clip((100 - data['attendance_avg'].to_numpy(dtype='float64', na_value=np.nan)) / RISK_FULL_ATTENDANCE_GAP, 0, 1),
+        1 - percentile.to_numpy(dtype='float64') / 100,
+        np.clip(-overall_growth.to_numpy(dtype='float64') / RISK_FULL_DECLINE, 0, 1),
+        1 - data['entry_score'].to_numpy(dtype='float64', na_value=np.nan) / ENTRY_SCORE_MAX
+    ])
+    weights = np.array([RISK_WEIGHTS[name] for name in ['attendance', 'achievement', 'decline', 'entry']])
+    known = ~np.isnan(factors)
+    weighted = np.where(known, factors, 0) @ weights
+    total = known @ weights
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return pd.Series(100 * weighted / total, index=data.index, name='risk_score')
+
+
+def risk_bands(scores):
+    """``RISK_BANDS`` label for each score; students with no factors at all get none."""
+    values = scores.to_numpy()
+    labels = [label for label, _ in RISK_BANDS] + [DEFAULT_RISK_BAND]
+    codes = np.select([values >= minimum for _, minimum in RISK_BANDS], range(len(RISK_BANDS)), default=len(RISK_BANDS))
+    codes[np.isnan(values)] = -1
+    return pd.Series(pd.Categorical.from_codes(codes, categories=labels), index=scores.index, name='risk_band')
+
+
+def _pearson(sums):
+    # Pearson r from n, Σx, Σy, Σxy, Σx², Σy² (one row per cohort)
+    n, x, y, xy, xx, yy = sums
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return (n * xy - x * y) / np.sqrt((n * xx - x * x) * (n * yy - y * y))
+
+
+def correlations(data, overall_growth):
+    """Pearson correlation of entry_score with each outcome, for every grade and all grades.
+
+    Built from per-grade sums (``np.bincount``), so every grade costs one
+    pass over the table rather than a filtered copy of it.
+    """
+    outcomes = {
+        'Mid-Year Avg': data['mid_year_avg'].to_numpy(dtype='float64', na_value=np.nan),
+        'End-Year Avg': data['end_year_avg'].to_numpy(dtype='float64', na_value=np.nan),
+        'Growth': overall_growth.to_numpy(dtype='float64'),
+        'Attendance': data['attendance_avg'].to_numpy(dtype='float64', na_value=np.nan)
+    }
+    entry = data['entry_score'].to_numpy(dtype='float64', na_value=np.nan)
+    grades, grade = np.unique(data['grade'].to_numpy(), return_inverse=True)
+    table = {}
+    for name, values in outcomes.items():
+        both = ~(np.isnan(entry) | np.isnan(values))
+        x, y, at = entry[both], values[both], grade[both]
+        sums = np.array([
+            np.bincount(at, weights=weights, minlength=len(grades))
+            for weights in [None, x, y, x * y, x * x, y * y]
+        ])
+        table[name] = _pearson(np.column_stack([sums, sums.sum(axis=1)]))
+    return pd.DataFrame(table, index=pd.Index([f"Grade {g}" for g in grades] + ['All Grades'], name='Cohort'))
+
+
+def analyze(data):
+    """Growth, percentile ranks, entry_score correlation and risk for every student in ``data``."""
+    change = growth(data)
+    percentile = percentile_ranks(data, latest_average(data))
+    risk = risk_scores(data, percentile, change['Overall'])
+    students = pd.concat([
+        data[['name', 'center', 'grade']],
+        change.add_prefix('growth_'),
+        percentile.rename('percentile'),
+        risk,
+        risk_bands(risk)
+    ], axis=1)
+
+    by_center = change.groupby(data['center'], observed=True).mean()
+    by_center.loc['All Centers'] = change.mean()
+
+    risk_counts = students['risk_band'].value_counts(sort=False)
+    return CohortAnalytics(students, by_center, correlations(data, change['Overall']), risk_counts)
+
+
+@per_version
+def cohort(store):
+    """``analyze()`` of the whole table, recomputed only when the data changes."""
+    return analyze(store.frame())
+
+
+@per_version
+def highest_risk(store, n):
+    """The ``n`` students with the highest risk score, highest first."""
+    return cohort(store).students.nlargest(n, 'risk_score')
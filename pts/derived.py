@@ -0,0 +1,43 @@
+# pts/derived.py
+# Declarative derived columns, kept in step with the columns they read from
+
+import pandas as pd
+
+# Each derived column is the mean of its inputs; missing inputs (scores not yet
+# entered) are skipped rather than counted as zero
+DERIVED_COLUMNS = {
+    'attendance_avg': ['attendance_mid', 'attendance_end'],
+    'mid_year_avg': ['mid_year_math', 'mid_year_english', 'mid_year_science'],
+    'end_year_avg': ['end_year_math', 'end_year_english', 'end_year_science']
+}
+
+# Shown in place of a value with nothing entered yet (a derived column with no inputs)
+MISSING = "—"
+
+
+def display(value, spec='.1f', suffix='%'):
+    """``value`` formatted for a page, e.g. ``82.3%``; ``MISSING`` if it is NaN or NA."""
+    if pd.isna(value):
+        return MISSING
+    return f"{value:{spec}}{suffix}"
+
+
+def affected(columns):
+    """Derived columns that read from any of ``columns``."""
+    columns = set(columns)
+    return [name for name, inputs in DERIVED_COLUMNS.items() if columns.intersection(inputs)]
+
+
+def rebuild(data):
+    """Recompute every derived column over the whole table (bulk loads)."""
+    for name, inputs in DERIVED_COLUMNS.items():
+        data[name] = data[inputs].astype('float64').mean(axis=1)
+    return data
+
+
+def refresh(data, student_ids, columns):
+    """Recompute only the derived cells a write to ``columns`` of ``student_ids`` can change."""
+    for name in affected(columns):
+        means = data.loc[student_ids, DERIVED_COLUMNS[name]].astype('float64').mean(axis=1)
+        data.loc[student_ids, name] = means.to_numpy(dtype=data[name].dtype)
+    return data
@@ -0,0 +1,103 @@
+# pts/export.py
+# Report exports built chunk by chunk, so building one copies only a chunk of the table at a time
+
+import io
+import re
+import tempfile
+from collections import namedtuple
+
+import numpy as np
+
+# Rows read from the store, converted and written per step
+EXPORT_CHUNK_ROWS = 50_000
+# Files being built stay in memory up to this size and spill to a temporary file beyond it
+SPOOL_BYTES = 8 * 1024 * 1024
+# One header row plus data rows
+EXCEL_MAX_ROWS = 1_048_575
+
+# label -> extension, MIME type, writer(chunks, out), row limit (None for unlimited)
+Format = namedtuple('Format', ['extension', 'mime', 'write', 'max_rows'])
+
+
+def chunks(data, columns, student_ids=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    """``data[columns]`` for ``student_ids`` (all rows if None), one ``chunk_rows`` DataFrame at a time.
+
+    Rows and columns are picked together by position, so each step copies
+    only the cells it exports and never the whole filtered table.
+    """
+    column_at = data.columns.get_indexer(columns)
+    if (column_at < 0).any():
+        raise KeyError(f"Unknown columns: {[c for c, at in zip(columns, column_at) if at < 0]}")
+    rows = np.arange(len(data)) if student_ids is None else data.index.get_indexer(student_ids)
+    for start in range(0, len(rows), chunk_rows):
+        yield data.iloc[rows[start:start + chunk_rows], column_at]
+
+
+def _write_csv(chunks, out):
+    text = io.TextIOWrapper(out, encoding='utf-8', newline='')
+    for i, chunk in enumerate(chunks):
+        chunk.to_csv(text, header=i == 0)
+    text.flush()
+    text.detach()
+
+
+def _write_parquet(chunks, out):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk)
+            if writer is None:
+                writer = pq.ParquetWriter(out, table.schema)
+            # One row group per chunk; later chunks are cast to the first chunk's schema
+            writer.write_table(table.cast(writer.schema))
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _write_excel(chunks, out):
+    from openpyxl import Workbook
+
+    # Write-only mode streams rows to disk instead of keeping cell objects
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Export")
+    for i, chunk in enumerate(chunks):
+        if i == 0:
+            sheet.append([chunk.index.name] + list(chunk.columns))
+        values = chunk.astype(object).where(chunk.notna(), None)
+        for student_id, row in zip(chunk.index, values.itertuples(index=False, name=None)):
+            sheet.append([student_id, *row])
+    workbook.save(out)
+
+
+FORMATS = {
+    'CSV': Format('csv', 'text/csv', _write_csv, None),
+    'Parquet': Format('parquet', 'application/vnd.apache.parquet', _write_parquet, None),
+    'Excel': Format('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', _write_excel, EXCEL_MAX_ROWS)
+}
+
+
+def export(data, columns, fmt, student_ids=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    """The bytes of a ``fmt`` file holding the selected rows and columns.
+
+    ``student_ids`` keeps ``data`` order if None, otherwise follows it; the
+    index (``student_id``) is always written as the first column. Only the
+    build is bounded: the finished file is returned whole, as
+    ``st.download_button`` holds it in memory to serve it anyway.
+    """
+    spec = FORMATS[fmt]
+    count = len(data) if student_ids is None else len(student_ids)
+    if spec.max_rows is not None and count > spec.max_rows:
+        raise ValueError(f"{fmt} holds at most {spec.max_rows:,} rows; this export has {count:,}")
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES) as out:
+        spec.write(chunks(data, columns, student_ids, chunk_rows), out)
+        out.seek(0)
+        return out.read()
+
+
+def file_name(title, fmt):
+    """A download file name such as ``student_performance_summary.csv``."""
+    return f"{'_'.join(re.findall(r'[a-z0-9]+', title.lower()))}.{FORMATS[fmt].extension}"
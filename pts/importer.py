@@ -0,0 +1,105 @@
+# pts/importer.py
+# Bulk student import: read an uploaded CSV / Excel file and validate it in one pass
+
+import numpy as np
+import pandas as pd
+
+from pts.store import CENTERS, COLUMNS, GRADES, SCHOLARSHIP_STATUSES, TEACHERS
+
+REQUIRED_COLUMNS = ['name', 'grade', 'center', 'teacher_assigned']
+
+# Inclusive bounds for the numeric columns an upload may carry
+RANGES = {
+    'age': (13, 17),
+    'entry_score': (0, 30),
+    'mid_year_math': (0, 100),
+    'mid_year_english': (0, 100),
+    'mid_year_science': (0, 100),
+    'end_year_math': (0, 100),
+    'end_year_english': (0, 100),
+    'end_year_science': (0, 100),
+    'attendance_mid': (0, 100),
+    'attendance_end': (0, 100)
+}
+
+# Allowed values for the categorical columns
+CHOICES = {
+    'grade': GRADES,
+    'center': CENTERS,
+    'teacher_assigned': TEACHERS,
+    'scholarship_status': SCHOLARSHIP_STATUSES
+}
+
+
+def template():
+    """An empty CSV with the accepted headers, for admins to fill in."""
+    return pd.DataFrame(columns=COLUMNS).to_csv(index=False)
+
+
+def read_upload(uploaded_file):
+    """Read a Streamlit upload (CSV or Excel .xlsx, via openpyxl) into a DataFrame."""
+    if uploaded_file.name.lower().endswith('.xlsx'):
+        return pd.read_excel(uploaded_file)
+    return pd.read_csv(uploaded_file)
+
+
+def validate(upload, center=None):
+    """Split an upload into rows ready for ``StudentStore.add_many`` and rejected rows.
+
+    Every check runs column-wise over the whole upload. ``center`` pins the
+    import to one center (coordinators); rows for any other center are
+    rejected. Returns ``(valid, errors)`` where ``errors`` lists the
+    spreadsheet row number and the reasons each rejected row failed.
+    """
+    upload = upload.rename(columns=lambda c: str(c).strip().lower().replace(' ', '_'))
+    missing = [c for c in REQUIRED_COLUMNS if c not in upload.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+    data = upload[[c for c in COLUMNS if c in upload.columns]].copy()
+    data['name'] = data['name'].astype('string').str.strip()
+    for column in [*RANGES, 'grade']:
+        if column in data:
+            data[column] = pd.to_numeric(data[column], errors='coerce')
+    if center is not None and 'center' in data:
+        data['center'] = data['center'].fillna(center)
+    # Blank cells get the Add New Student form's defaults, as a column left out does
+    if 'scholarship_status' not in data:
+        data['scholarship_status'] = 'Active'
+    data['scholarship_status'] = data['scholarship_status'].fillna('Active')
+    if 'continuation_approved' not in data:
+        data['continuation_approved'] = None
+    data['continuation_approved'] = data['continuation_approved'].where(
+        data['continuation_approved'].notna(), np.where(data['grade'] == 9, None, 'N/A')
+    )
+
+    problems = {'name is required': data['name'].isna() | (data['name'] == '')}
+    for column, choices in CHOICES.items():
+        if column in data:
+            problems[f"unknown {column}"] = ~data[column].isin(choices)
+    for column, (low, high) in RANGES.items():
+        if column in data:
+            values = data[column]
+            problems[f"{column} outside {low}-{high}"] = values.notna() & ~values.between(low, high)
+            # The store keeps these as whole numbers
+            problems[f"{column} not a whole number"] = values.notna() & (values % 1 != 0)
+    if center is not None:
+        problems[f"not in {center}"] = data['center'] != center
+
+    failed = pd.DataFrame(problems, index=data.index)
+    bad = failed.any(axis=1)
+
+    valid = data[~bad].copy()
+    valid['grade'] = valid['grade'].astype(int)
+
+    rejected = failed[bad]
+    reasons = pd.Series('', index=rejected.index)
+    for label, flags in rejected.items():
+        reasons += np.where(flags, label + '; ', '')
+    errors = pd.DataFrame({
+        # +2: one for the header line, one because spreadsheets count from 1
+        'row': rejected.index + 2,
+        'name': data.loc[bad, 'name'],
+        'problems': reasons.str.rstrip('; ')
+    })
+    return valid.reset_index(drop=True), errors.reset_index(drop=True)
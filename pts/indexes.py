@@ -0,0 +1,167 @@
+# pts/indexes.py
+# Hash indexes over student columns, and a name search index, so pages look rows up instead of scanning
+
+from bisect import bisect_left, insort
+from collections import defaultdict
+from difflib import SequenceMatcher
+
+import pandas as pd
+
+# How alike (difflib ratio, 0-1) a name word must be to a misspelt query word
+FUZZY_CUTOFF = 0.75
+
+
+def _key(value):
+    # Missing values (None / NaN) all share one key so they can be looked up too
+    return None if pd.isna(value) else value
+
+
+class HashIndex:
+    """Maps each value of one column to the set of ``student_id``s holding it."""
+
+    def __init__(self, column):
+        self.column = column
+        self._ids = defaultdict(set)
+
+    def build(self, series):
+        self._ids.clear()
+        missing = series.isna()
+        present = series[~missing]
+        for value, ids in present.index.groupby(present.to_numpy()).items():
+            self._ids[value].update(ids.tolist())
+        if missing.any():
+            self._ids[None].update(series.index[missing].tolist())
+
+    def get(self, value):
+        return self._ids.get(_key(value), set())
+
+    def add(self, student_id, value):
+        self._ids[_key(value)].add(student_id)
+
+    def move(self, student_id, old, new):
+        old, new = _key(old), _key(new)
+        if old == new:
+            return
+        bucket = self._ids.get(old)
+        if bucket is not None:
+            bucket.discard(student_id)
+            if not bucket:
+                del self._ids[old]
+        self._ids[new].add(student_id)
+
+
+def _words(text):
+    return str(text).casefold().split()
+
+
+def _grams(word):
+    # Padded so the start and end of a word count, e.g. 'das' -> ' da', 'das', 'as '
+    word = f" {word} "
+    return {word[i:i + 3] for i in range(len(word) - 2)}
+
+
+class NameIndex:
+    """Finds students by name: word prefixes first, then close spellings.
+
+    ``_words`` is a sorted list of (word, student_id) pairs, so the students
+    with a name word starting with a prefix are one ``bisect`` range.
+    ``_grams`` maps trigrams to the distinct name words containing them, which
+    narrows a misspelt word to a handful of candidate spellings before they
+    are compared. As a store listener it follows inserts and renames; the
+    word list is copied and swapped on write, so a search running on a
+    session thread never sees it half-updated.
+    """
+
+    def __init__(self):
+        self._names = {}
+        self._words = []
+        self._grams = {}
+
+    def _with_grams(self, words):
+        # A new trigram map including ``words``; touched sets are replaced, not changed
+        grams = dict(self._grams)
+        added = defaultdict(set)
+        for word in words:
+            for gram in _grams(word):
+                added[gram].add(word)
+        for gram, new in added.items():
+            grams[gram] = grams.get(gram, set()) | new
+        return grams
+
+    def rebuild(self, data):
+        names = data['name'].dropna().to_dict()
+        words = sorted((word, sid) for sid, name in names.items() for word in set(_words(name)))
+        self._grams = {}
+        self._grams = self._with_grams({word for word, _ in words})
+        self._names, self._words = names, words
+
+    def apply(self, before, after):
+        if after is None:
+            return
+        names = after['name']
+        if before is not None:
+            names = names[names.ne(before['name'].reindex(names.index))]
+        names = names.dropna().to_dict()
+        if not names:
+            return
+        words = list(self._words)
+        for sid, name in names.items():
+            for word in set(_words(self._names.get(sid, ''))):
+                at = bisect_left(words, (word, sid))
+                if at < len(words) and words[at] == (word, sid):
+                    del words[at]
+            for word in set(_words(name)):
+                insort(words, (word, sid))
+        # Words no longer in any name stay in _grams; their range is just empty
+        grams = self._with_grams({word for name in names.values() for word in _words(name)})
+        self._names.update(names)
+        self._words, self._grams = words, grams
+
+    def _students(self, words, prefix):
+        start = bisect_left(words, (prefix,))
+        stop = bisect_left(words, (prefix + '\uffff',), start)
+        return (words[i][1] for i in range(start, stop))
+
+    def _close(self, term):
+        # Known words spelt like ``term``, most similar first
+        candidates = set().union(*(self._grams.get(gram, ()) for gram in _grams(term)))
+        scored = [(SequenceMatcher(None, term, word).ratio(), word) for word in candidates]
+        return [word for ratio, word in sorted(scored, reverse=True) if ratio >= FUZZY_CUTOFF]
+
+    def _collect(self, found, candidates, others, limit):
+        # Append candidates whose name also has a word starting with each of ``others``
+        names = self._names
+        for sid in candidates:
+            if len(found) == limit:
+                return
+            if sid in found:
+                continue
+            if others:
+                name_words = _words(names[sid])
+                if not all(any(word.startswith(term) for word in name_words) for term in others):
+                    continue
+            found.append(sid)
+
+    def search(self, query, limit=10):
+        """Up to ``limit`` ``student_id``s whose name best matches ``query``.
+
+        Students with a name word starting with every query word come first,
+        in order of that word. If that leaves room, the longest query word is
+        also matched against close spellings (``FUZZY_CUTOFF``), so a misspelt
+        name still finds its student.
+        """
+        terms = _words(query)
+        if not terms or limit <= 0:
+            return []
+        words = self._words
+
+        # Narrow by the longest word (the smallest range), then check the rest
+        longest = max(terms, key=len)
+        others = [term for term in terms if term != longest]
+        found = []
+        self._collect(found, self._students(words, longest), others, limit)
+        if len(found) < limit and len(longest) >= 3:
+            for spelling in self._close(longest):
+                if not spelling.startswith(longest):
+                    self._collect(found, self._students(words, spelling), others, limit)
+        return found
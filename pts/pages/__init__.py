@@ -0,0 +1,20 @@
+# pts/pages/__init__.py
+# One module per app page, imported the first time that page is opened
+
+import importlib
+
+# Sidebar title -> module under pts.pages; each module has render(store)
+PAGES = {
+    "Dashboard Overview": "dashboard",
+    "Student Details": "student_details",
+    "Add New Student": "add_student",
+    "Bulk Import": "bulk_import",
+    "Data Entry": "data_entry",
+    "Scholarship Approvals": "approvals",
+    "Reports & Analytics": "analytics"
+}
+
+
+def render(page, store):
+    """Draw ``page``, importing its module (and that module's dependencies) on first use."""
+    importlib.import_module(f"pts.pages.{PAGES[page]}").render(store)
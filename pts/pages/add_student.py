@@ -0,0 +1,60 @@
+# pts/pages/add_student.py
+# Add New Student: admins pick any center, coordinators add to their own
+
+import streamlit as st
+
+from pts.pages.common import fragment
+from pts.store import CENTERS, GRADES, TEACHERS
+
+
+def render(store):
+    if st.session_state["role"] not in ["admin", "coordinator"]:
+        st.error("Access Denied: Only admins and coordinators can add new students")
+        st.stop()
+
+    st.header("➕ Add New Student to Program")
+    _new_student_form(store)
+
+
+# The form's own widgets rerun only this section; a successful add reruns the app
+@fragment
+def _new_student_form(store):
+    with st.form("new_student_form"):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            new_name = st.text_input("Student Name *")
+            new_grade = st.selectbox("Grade *", GRADES)
+            new_age = st.number_input("Age", 13, 17, 14 if new_grade == 9 else 15)
+
+            # Coordinator can only add to their center, admin can choose
+            if st.session_state["role"] == "admin":
+                new_center = st.selectbox("Center", CENTERS)
+            else:  # coordinator
+                new_center = "Saltlake Center"  # Their assigned center
+                st.text_input("Center", value=new_center, disabled=True)
+
+        with col2:
+            new_entry_score = st.number_input("Entry Score (out of 30)", 0, 30, 24)
+            new_teacher = st.selectbox("Assign Teacher", TEACHERS)
+            scholarship_status = st.selectbox("Initial Status", ["Active", "Under Review"])
+
+        if st.form_submit_button("✅ Add Student to Program", type="primary"):
+            if new_name:
+                new_student = {
+                    'name': new_name,
+                    'grade': new_grade,
+                    'age': new_age,
+                    'center': new_center,
+                    'scholarship_status': scholarship_status,
+                    'entry_score': new_entry_score,
+                    'continuation_approved': None if new_grade == 9 else 'N/A',
+                    'teacher_assigned': new_teacher
+                }
+
+                store.add(new_student)
+
+                st.success(f"✅ {new_name} has been added to the program!")
+                st.rerun()
+            else:
+                st.error("Please enter student name")
@@ -0,0 +1,176 @@
+# pts/pages/analytics.py
+# Reports & Analytics: on-demand reports plus live charts of the whole cohort
+
+import time
+
+import pandas as pd
+import streamlit as st
+
+from pts import charts, cohort, export, reports
+from pts.derived import display
+from pts.pages.common import fragment, table
+from pts.profiling import profiler
+
+# Columns of the Detailed Data table, and the default export columns
+DETAIL_COLUMNS = ['name', 'grade', 'attendance_avg', 'mid_year_avg', 'end_year_avg', 'scholarship_status']
+
+# Students listed under Highest Risk Students
+RISK_LIST_SIZE = 20
+
+
+# Report worker pool and result cache, shared by every session
+@st.cache_resource
+def get_report_engine():
+    return reports.ReportEngine()
+
+
+def render(store):
+    st.header("📈 Reports & Analytics")
+    _report_builder(store)
+
+    # Analytics Dashboard
+    st.subheader("📊 Live Analytics")
+
+    # Every chart is drawn from fixed-size bins computed on the server and cached per data version
+    with profiler.timed("analytics.charts"):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.write("**Attendance Distribution**")
+            st.plotly_chart(charts.attendance_figure(store), use_container_width=True)
+
+        with col2:
+            st.write("**Scholarship Status**")
+            st.plotly_chart(charts.status_figure(store), use_container_width=True)
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.write("**Score Distribution**")
+            st.plotly_chart(charts.scores_figure(store), use_container_width=True)
+
+        with col2:
+            st.write("**Attendance vs End-Year Average**")
+            st.plotly_chart(charts.attendance_vs_score_figure(store), use_container_width=True)
+
+    # Per-period averages from the long assessments table, cached until scores change
+    st.write("**Average Score by Assessment Period**")
+    by_period = store.assessments.summary()['mean'].unstack('subject').round(1)
+    st.dataframe(by_period, use_container_width=True)
+
+    _cohort_analytics(store)
+
+
+def _cohort_analytics(store):
+    st.subheader("🧭 Cohort Analytics")
+
+    # One vectorized pass over the whole table, recomputed only when the data changes
+    with profiler.timed("analytics.cohort"):
+        analytics = cohort.cohort(store)
+        overall = analytics.growth.loc['All Centers']
+
+        cols = st.columns(len(overall) + len(analytics.risk_counts))
+        for col, (subject, change) in zip(cols, overall.items()):
+            with col:
+                st.metric(f"{subject} Growth", display(change, '+.1f', ' pts'))
+        for col, (band, students) in zip(cols[len(overall):], analytics.risk_counts.items()):
+            with col:
+                st.metric(f"{band} Risk", int(students))
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.write("**Mid- to End-Year Growth by Center**")
+            st.dataframe(analytics.growth.round(1), use_container_width=True)
+
+        with col2:
+            st.write("**Entry Score Correlation with Outcomes**")
+            st.dataframe(analytics.correlation.round(2), use_container_width=True)
+
+        st.write(f"**Highest Risk Students** (top {RISK_LIST_SIZE})")
+        st.caption(
+            "Risk (0-100) weighs attendance, percentile rank within center and grade, "
+            "mid- to end-year decline and entry score."
+        )
+        highest = cohort.highest_risk(store, RISK_LIST_SIZE)
+        st.dataframe(
+            highest[['name', 'center', 'grade', 'growth_Overall', 'percentile', 'risk_score', 'risk_band']].round(1),
+            use_container_width=True, hide_index=True
+        )
+
+
+# Choosing and generating a report reruns only this section, not the charts
+@fragment
+def _report_builder(store):
+    # Generate Report Section
+    st.subheader("📄 Generate Custom Reports")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        report_type = st.selectbox("Report Type", list(reports.REPORTS))
+
+    with col2:
+        grade_filter = st.selectbox("Grade Filter", list(reports.GRADE_FILTERS))
+
+    if st.button("🚀 Generate Report", type="primary"):
+        # Built on the shared worker pool; an identical request at the same data version reuses the result
+        st.session_state.report_job = get_report_engine().submit(store, report_type, grade_filter)
+        st.session_state.report_grade_filter = grade_filter
+
+    if 'report_job' in st.session_state:
+        job = st.session_state.report_job
+        if not job.done():
+            progress_bar = st.progress(job.fraction, text=job.text)
+            with profiler.timed("reports.wait"):
+                while not job.done():
+                    time.sleep(0.1)
+                    progress_bar.progress(job.fraction, text=job.text)
+            progress_bar.empty()
+        report = job.result()
+
+        st.success("✅ Report generated successfully!")
+
+        # Display summary
+        st.subheader(f"{report.title} - Summary")
+        for col, (label, value) in zip(st.columns(len(report.metrics)), report.metrics.items()):
+            with col:
+                st.metric(label, value)
+
+        for title, summary in report.tables.items():
+            st.subheader(title)
+            st.dataframe(summary, use_container_width=True, hide_index=True)
+
+        # Detailed data table, one page at a time, read straight from the store
+        grade = reports.GRADE_FILTERS[st.session_state.report_grade_filter]
+        student_ids = store.frame().index if grade is None else pd.Index(store.ids(grade=grade), name='student_id')
+        st.subheader("Detailed Data")
+        with profiler.timed("reports.detailed_table"):
+            table(store, student_ids, DETAIL_COLUMNS, key="report_detail")
+
+        _export(store, f"{report.title} {st.session_state.report_grade_filter}", None if grade is None else student_ids)
+
+
+def _export(store, title, student_ids):
+    st.write("**Export**")
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        columns = st.multiselect("Columns", list(store.frame().columns), default=DETAIL_COLUMNS)
+    with col2:
+        fmt = st.selectbox("Format", list(export.FORMATS))
+
+    count = len(store.frame()) if student_ids is None else len(student_ids)
+    spec = export.FORMATS[fmt]
+    too_many = spec.max_rows is not None and count > spec.max_rows
+    if too_many:
+        st.warning(f"{fmt} holds at most {spec.max_rows:,} rows; choose CSV or Parquet for all {count:,}.")
+
+    # The file is built only when the button is clicked, in fixed-size chunks of
+    # just the chosen columns; Streamlit then serves the finished bytes
+    st.download_button(
+        f"⬇️ Download {count:,} rows as {fmt}",
+        data=lambda: export.export(store.frame(), columns, fmt, student_ids),
+        file_name=export.file_name(title, fmt),
+        mime=spec.mime,
+        disabled=too_many or not columns
+    )
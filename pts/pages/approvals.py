@@ -0,0 +1,122 @@
+# pts/pages/approvals.py
+# Scholarship Approvals: the Grade 9 -> Grade 10 continuation queue
+
+import streamlit as st
+
+from pts import rules
+from pts.derived import display
+from pts.pages.common import fragment, paginate, rerun_fragment, show_saved, table
+from pts.store import WriteConflict
+
+
+def render(store):
+    if st.session_state["role"] != "admin":
+        st.error("Access Denied: Only admins can approve scholarship continuations")
+        st.stop()
+
+    st.header("Admin Panel - Scholarship Continuation Approvals")
+    _queue(store)
+
+
+def _decide(store, student_ids, decision, read_version):
+    try:
+        store.update_many(rules.decide(student_ids, decision), read_version)
+    except WriteConflict as conflict:
+        st.warning(f"{len(conflict.student_ids)} student(s) were changed by someone else since this queue was shown; nothing was saved. Review the refreshed queue.")
+        st.stop()
+    st.session_state.show_success = True
+    rerun_fragment()
+
+
+# Filtering, paging and every decision rerun only the queue
+@fragment
+def _queue(store):
+    show_saved()
+
+    # Decisions apply to the queue as the admin last saw it; see Data Entry
+    read_version = st.session_state.get("approvals_read_version", store.version)
+    st.session_state.approvals_read_version = store.version
+
+    # Grade 9 students who need continuation approval, already classified
+    pending = store.view('approval_queue')
+    grade_9_students = pending.students
+
+    if len(grade_9_students) == 0:
+        st.success("✅ No pending approval requests")
+
+        # Show approved/rejected students
+        st.subheader("Previously Processed")
+        processed = sorted(set(store.ids(grade=9)) - set(grade_9_students.index))
+        if len(processed) > 0:
+            table(store, processed, ['name', 'end_year_avg', 'attendance_end', 'continuation_approved'], key="processed_approvals")
+    else:
+        st.subheader("📋 Pending Approvals for Grade 9 → Grade 10 Continuation")
+
+        recommendation = pending.recommendation
+        counts = pending.counts
+
+        cols = st.columns(len(rules.RECOMMENDATIONS))
+        for col, label in zip(cols, rules.RECOMMENDATIONS):
+            with col:
+                st.metric(label, int(counts.get(label, 0)))
+
+        with st.expander("Recommendation rules"):
+            for rule in rules.CONTINUATION_RULES:
+                st.write(f"**{rule.label}:** " + ", ".join(f"{column} ≥ {minimum}" for column, minimum in rule.minimums.items()))
+            st.write(f"**{rules.DEFAULT_RECOMMENDATION}:** everyone else")
+
+        show = st.selectbox("Show", ["All"] + rules.RECOMMENDATIONS)
+        queue = grade_9_students if show == "All" else grade_9_students[recommendation == show]
+
+        # Batch actions over everything the filter shows, committed as one write
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            if st.button(f"✅ Approve all {len(queue)} shown", disabled=len(queue) == 0):
+                _decide(store, queue.index, 'Approve', read_version)
+        with col2:
+            if st.button(f"⏸️ Hold all {len(queue)} shown", disabled=len(queue) == 0):
+                _decide(store, queue.index, 'Hold', read_version)
+        with col3:
+            if st.button(f"❌ Reject all {len(queue)} shown", disabled=len(queue) == 0):
+                _decide(store, queue.index, 'Reject', read_version)
+
+        for student in paginate(queue, key="approval_queue").itertuples():
+            idx = student.Index
+            with st.expander(f"Review: {student.name}", expanded=True):
+                col1, col2, col3 = st.columns(3)
+
+                with col1:
+                    st.write("**Performance Summary**")
+                    st.write(f"Entry Score: {display(student.entry_score, '', '/30')}")
+                    st.write(f"Mid-Year Avg: {display(student.mid_year_avg)}")
+                    st.write(f"End-Year Avg: {display(student.end_year_avg)}")
+
+                with col2:
+                    st.write("**Attendance**")
+                    st.write(f"Mid-Year: {display(student.attendance_mid, '')}")
+                    st.write(f"End-Year: {display(student.attendance_end, '')}")
+                    st.write(f"Average: {display(student.attendance_avg)}")
+
+                with col3:
+                    st.write("**Recommendation**")
+                    label = recommendation[idx]
+                    if label == 'Recommended':
+                        st.success("✅ Recommended for Continuation")
+                    elif label == 'Conditional':
+                        st.warning("⚠️ Conditional Continuation")
+                    else:
+                        st.error("❌ At Risk - Review Required")
+
+                # Approval buttons
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    if st.button(f"✅ Approve", key=f"approve_{idx}"):
+                        _decide(store, [idx], 'Approve', read_version)
+
+                with col2:
+                    if st.button(f"❌ Reject", key=f"reject_{idx}"):
+                        _decide(store, [idx], 'Reject', read_version)
+
+                with col3:
+                    if st.button(f"⏸️ Hold", key=f"hold_{idx}"):
+                        _decide(store, [idx], 'Hold', read_version)
@@ -0,0 +1,61 @@
+# pts/pages/bulk_import.py
+# Bulk Import: validate an uploaded CSV/Excel file and add its valid rows
+
+import streamlit as st
+
+from pts import importer
+from pts.pages.common import fragment, rerun_fragment
+
+
+def render(store):
+    if st.session_state["role"] not in ["admin", "coordinator"]:
+        st.error("Access Denied: Only admins and coordinators can import students")
+        st.stop()
+
+    st.header("📥 Bulk Student Import")
+    _importer(store)
+
+
+# Uploading, reviewing and importing rerun only this section
+@fragment
+def _importer(store):
+    # Coordinators can only import into their own center
+    import_center = None if st.session_state["role"] == "admin" else "Saltlake Center"
+
+    st.write("Upload a CSV or Excel file with one student per row. "
+             "Required columns: " + ", ".join(importer.REQUIRED_COLUMNS) + ".")
+    st.download_button("⬇️ Download CSV template", importer.template(), file_name="students_template.csv", mime="text/csv")
+
+    # Shown once, after the rerun that cleared the imported file
+    imported = st.session_state.pop("students_imported", None)
+    if imported:
+        st.success(f"✅ Imported {imported} students into the program!")
+
+    # A new key after each import empties the uploader, so the same file cannot be imported twice
+    upload_round = st.session_state.setdefault("student_upload_round", 0)
+    uploaded = st.file_uploader("Student file", type=["csv", "xlsx"], key=f"student_upload_{upload_round}")
+
+    if uploaded is not None:
+        try:
+            valid, errors = importer.validate(importer.read_upload(uploaded), center=import_center)
+        except (ValueError, ImportError) as e:
+            st.error(f"Could not read {uploaded.name}: {e}")
+            st.stop()
+
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Ready to Import", len(valid))
+        with col2:
+            st.metric("Rejected Rows", len(errors))
+
+        if len(errors) > 0:
+            st.warning(f"{len(errors)} rows failed validation and will be skipped")
+            st.dataframe(errors, use_container_width=True, hide_index=True)
+
+        if len(valid) > 0:
+            st.dataframe(valid.head(20), use_container_width=True, hide_index=True)
+            if st.button(f"✅ Import {len(valid)} Students", type="primary"):
+                store.add_many(valid)
+                st.session_state.students_imported = len(valid)
+                st.session_state.student_upload_round += 1
+                rerun_fragment()
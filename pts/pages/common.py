@@ -0,0 +1,93 @@
+# pts/pages/common.py
+# Widgets and constants shared by more than one page
+
+import functools
+
+import pandas as pd
+import pyarrow as pa
+import streamlit as st
+from streamlit.errors import StreamlitAPIException
+
+from pts.cache import per_version
+from pts.profiling import profiler
+
+# Score columns and the (period, subject) they hold
+SUBJECT_COLUMNS = {
+    'mid_year_math': ('Mid-Year', 'Math'),
+    'mid_year_english': ('Mid-Year', 'English'),
+    'mid_year_science': ('Mid-Year', 'Science'),
+    'end_year_math': ('End-Year', 'Math'),
+    'end_year_english': ('End-Year', 'English'),
+    'end_year_science': ('End-Year', 'Science')
+}
+
+
+def fragment(fn):
+    """``st.fragment`` whose runs are timed as ``fragment.<page>.<name>`` in the profiler.
+
+    A widget inside a fragment reruns only that function, so fragments should
+    read what they show from the store rather than take it as arguments. The
+    store is the first argument; it is refreshed first, since a fragment
+    rerun skips the app script that otherwise does that.
+    """
+    name = f"fragment.{fn.__module__.rsplit('.', 1)[-1]}.{fn.__name__.lstrip('_')}"
+
+    @functools.wraps(fn)
+    def timed(store, *args, **kwargs):
+        store.refresh()
+        with profiler.timed(name):
+            return fn(store, *args, **kwargs)
+
+    return st.fragment(timed)
+
+
+def rerun_fragment():
+    """Rerun just the calling fragment (the whole app if this run was not a fragment rerun)."""
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
+
+
+def show_saved():
+    """The success banner for a save made on the previous run, shown once."""
+    if st.session_state.get("show_success"):
+        st.success("✅ Data saved successfully!")
+        st.session_state.show_success = False
+
+
+def paginate(data, key, page_sizes=(10, 25, 50)):
+    """Show page controls for ``data`` and return only the rows on the current page."""
+    col1, col2, col3 = st.columns([1, 1, 2])
+    with col1:
+        page_size = st.selectbox("Per page", page_sizes, key=f"{key}_size")
+    page_count = max(1, -(-len(data) // page_size))
+    # Keep the page number valid when the page size or the data shrinks
+    if st.session_state.get(f"{key}_page", 1) > page_count:
+        st.session_state[f"{key}_page"] = page_count
+    with col2:
+        page_number = st.number_input("Page", 1, page_count, 1, key=f"{key}_page")
+    start = (page_number - 1) * page_size
+    with col3:
+        st.caption(f"Showing {min(start + 1, len(data))}–{min(start + page_size, len(data))} of {len(data)}")
+    return data.iloc[start:start + page_size]
+
+
+@per_version
+def _page_table(store, student_ids, columns):
+    # Arrow is what st.dataframe sends; a table it is given goes out without a pandas conversion
+    rows = store.rows(list(student_ids), [column for column, _ in columns])
+    return pa.Table.from_pandas(rows.set_axis([header for _, header in columns], axis=1), preserve_index=False)
+
+
+def table(store, student_ids, columns, key, page_sizes=(10, 25, 50)):
+    """Page controls and an ``st.dataframe`` of the current page of ``student_ids``.
+
+    ``columns`` lists the store columns shown, or maps them to their headers.
+    Only those cells of the page's rows are read from the store, and the page
+    is kept, ready to send, until the data changes; a table costs the same to
+    draw however many students it pages through.
+    """
+    columns = tuple(columns.items() if isinstance(columns, dict) else zip(columns, columns))
+    page = paginate(pd.Series(student_ids, dtype='int64'), key=key, page_sizes=page_sizes)
+    st.dataframe(_page_table(store, tuple(page), columns), use_container_width=True, hide_index=True)
@@ -0,0 +1,181 @@
+# pts/pages/dashboard.py
+# Dashboard Overview: a different dashboard for each role
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from pts import views
+from pts.derived import display
+from pts.pages.common import SUBJECT_COLUMNS, fragment, paginate, table
+from pts.profiling import profiler
+
+# Store column -> header of the center student tables
+CENTER_STUDENT_COLUMNS = {
+    'name': 'Name',
+    'grade': 'Grade',
+    'attendance_avg': 'Attendance %',
+    'entry_score': 'Entry Score',
+    'scholarship_status': 'Status'
+}
+
+
+def render(store):
+    role = st.session_state["role"]
+    if role == "admin":
+        _admin(store)
+    elif role == "teacher":
+        _teacher(store)
+    elif role == "coordinator":
+        _coordinator(store)
+
+
+def _admin(store):
+    st.header("🏢 Admin Dashboard - Multi-Center Overview")
+
+    # Per-center rollups, maintained by the store as students change
+    center_data = store.rollup('center').round(1).reset_index()
+
+    # Multi-center metrics
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Centers", len(center_data), delta="Active")
+    with col2:
+        st.metric("Total Students", center_data['total_students'].sum(), delta="All Centers")
+    with col3:
+        st.metric("Total Scholarships", center_data['scholarships'].sum(), delta="Granted")
+    with col4:
+        network_score = (center_data['avg_score'] * center_data['total_students']).sum() / center_data['total_students'].sum()
+        st.metric("Network Avg Score", f"{network_score:.1f}/30", delta="System-wide")
+
+    # Center comparison table
+    st.subheader("📊 Center Performance Comparison")
+    st.dataframe(center_data, use_container_width=True, hide_index=True)
+    _center_details(store)
+
+
+# Picking a center redraws only its student table
+@fragment
+def _center_details(store):
+    selected_center = st.selectbox("View Center Details:", store.rollup('center').index.tolist())
+    center_students = store.view('center', selected_center).students
+
+    if len(center_students) > 0:
+        st.subheader(f"Students at {selected_center}")
+        with profiler.timed("admin.center_table"):
+            table(store, center_students.index, CENTER_STUDENT_COLUMNS, key="admin_center_students")
+
+
+def _teacher(store):
+    st.header("👩‍🏫 Teacher Dashboard - My Students")
+
+    # Students assigned to this teacher, cached until one of them changes
+    my_class = store.view('teacher', 'Teacher A')
+    teacher_students = my_class.students
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("My Students", len(teacher_students), delta="Assigned")
+    with col2:
+        st.metric("Avg Attendance", display(my_class.avg_attendance), delta="My Class")
+    with col3:
+        st.metric("Active Scholarships", my_class.active_scholarships, delta="Current")
+
+    st.subheader("📚 My Assigned Students")
+    _my_students(store)
+
+
+# The view switch, paging and per-card chart toggles rerun only this list
+@fragment
+def _my_students(store):
+    # Students assigned to this teacher, cached until one of them changes
+    teacher_students = store.view('teacher', 'Teacher A').students
+
+    view_mode = st.radio("View", ["Student Cards", "Combined Chart"], horizontal=True)
+
+    if view_mode == "Student Cards":
+        # One page of collapsed cards; a card's chart is only built when asked for
+        page_students = paginate(teacher_students, key="teacher_cards")
+
+        for student in page_students.itertuples():
+            with st.expander(f"👤 {student.name} - Grade {student.grade}"):
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    st.write(f"**Attendance:** {display(student.attendance_avg)}")
+                with col2:
+                    st.write(f"**Mid-Year Avg:** {display(student.mid_year_avg)}")
+                with col3:
+                    st.write(f"**End-Year Avg:** {display(student.end_year_avg)}")
+                with col4:
+                    st.write(f"**Status:** {student.scholarship_status}")
+
+                # Subject breakdown
+                if st.toggle("Show subject breakdown", key=f"subject_chart_{student.Index}"):
+                    subject_df = pd.DataFrame({
+                        'Subject': ['Math', 'English', 'Science'],
+                        'Mid-Year': [student.mid_year_math, student.mid_year_english, student.mid_year_science],
+                        'End-Year': [student.end_year_math, student.end_year_english, student.end_year_science]
+                    })
+                    st.bar_chart(subject_df.set_index('Subject'))
+    else:
+        # Every student's subject scores in one faceted figure, built with a single melt
+        with profiler.timed("teacher.combined_chart"):
+            # Labelled by id too, so students who share a name get their own bars
+            students = teacher_students[list(SUBJECT_COLUMNS)].assign(
+                Student=teacher_students['name'] + ' (#' + teacher_students.index.astype(str) + ')'
+            )
+            scores = students.melt(id_vars='Student', var_name='column', value_name='Score')
+            scores[['Period', 'Subject']] = scores['column'].map(SUBJECT_COLUMNS).tolist()
+            fig = px.bar(
+                scores, x='Student', y='Score', color='Period', facet_row='Subject',
+                barmode='group',
+                height=220 * 3
+            )
+            fig.for_each_annotation(lambda a: a.update(text=a.text.split('=')[-1]))
+            st.plotly_chart(fig, use_container_width=True)
+
+
+def _coordinator(store):
+    st.header("🏛️ Coordinator Dashboard - Center Management")
+
+    # Center-specific data
+    my_center = "Saltlake Center"
+    center = store.view('center', my_center)
+    center_summary = store.rollup('center').reindex([my_center]).fillna(0).iloc[0]
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Center Students", int(center_summary['total_students']), delta=my_center)
+    with col2:
+        st.metric("Avg Attendance", display(center_summary['avg_attendance']), delta="Center Average")
+    with col3:
+        st.metric("Active Scholarships", int(center_summary['scholarships']), delta="This Center")
+    with col4:
+        st.metric("At-Risk Students", len(center.at_risk), delta="Need Support")
+
+    # Grade-wise breakdown
+    st.subheader("📊 Grade-wise Performance")
+    grade_rollup = store.rollup('center_grade')
+    grade_stats = grade_rollup[grade_rollup.index.get_level_values('center') == my_center].droplevel('center').round(1)
+    grade_stats.columns = ['Avg Attendance', 'Avg Entry Score', 'Student Count']
+    st.dataframe(grade_stats, use_container_width=True)
+
+    # Student overview table
+    st.subheader("👥 All Center Students")
+    _center_students(store, my_center)
+
+    # Action items
+    st.subheader("⚠️ Attention Required")
+    at_risk = center.at_risk
+    if len(at_risk) > 0:
+        st.warning(f"{len(at_risk)} students have attendance below {views.AT_RISK_ATTENDANCE}%")
+        table(store, at_risk.index, ['name', 'grade', 'attendance_avg'], key="at_risk_students")
+    else:
+        st.success("All students maintaining good attendance!")
+
+
+# Paging through the center's students redraws only the table
+@fragment
+def _center_students(store, center):
+    with profiler.timed("coordinator.center_table"):
+        table(store, store.view('center', center).students.index, CENTER_STUDENT_COLUMNS, key="coordinator_center_students")
@@ -0,0 +1,73 @@
+# pts/pages/data_entry.py
+# Data Entry: teachers edit a period's scores for their class in one grid
+
+import streamlit as st
+
+from pts.pages.common import fragment, rerun_fragment, show_saved
+from pts.store import WriteConflict
+
+def render(store):
+    if st.session_state["role"] != "teacher":
+        st.error("Access Denied: Only teachers can enter assessment data")
+        st.stop()
+
+    st.header("📝 Teacher Data Entry - Assessment Scores")
+    _grid(store)
+
+
+# Switching period and saving rerun only the grid
+@fragment
+def _grid(store):
+    show_saved()
+
+    # The grid the teacher is saving was drawn at the previous run's version;
+    # rows written by anyone else since then are refused rather than overwritten
+    read_version = st.session_state.get("assessment_read_version", store.version)
+    st.session_state.assessment_read_version = store.version
+
+    # Students assigned to this teacher
+    assigned_students = store.view('teacher', 'Teacher A').students
+
+    # Any period and subject recorded in the long assessments table can be edited here
+    assessment_period = st.selectbox("Assessment Period", store.assessments.periods)
+    subjects = store.assessments.subjects_in(assessment_period)
+
+    st.write("Edit scores for all your students, then save once.")
+
+    original = store.assessments.pivot(assessment_period, student_ids=assigned_students.index).reindex(columns=subjects)
+    grid = original.copy()
+    grid.insert(0, 'Name', assigned_students['name'])
+
+    with st.form("assessment_entry"):
+        edited = st.data_editor(
+            grid,
+            key=f"assessment_grid_{assessment_period}",
+            disabled=['Name'],
+            column_config={
+                subject: st.column_config.NumberColumn(subject, min_value=0, max_value=100, step=1)
+                for subject in subjects
+            },
+            use_container_width=True
+        )
+
+        if st.form_submit_button("💾 Save Assessment Data", type="primary"):
+            # Diff the grid against the stored scores and commit only the cells that changed
+            # Compared as floats so a first score entered over an empty cell counts as a change
+            after = edited[subjects].set_axis(original.index).rename_axis(columns='subject').astype('float64')
+            changed = original.ne(after) & ~(original.isna() & after.isna())
+            cells = changed.stack()
+            changes = after.stack().loc[cells[cells].index].rename('score').reset_index()
+            changes.insert(1, 'period', assessment_period)
+
+            if changes.empty:
+                st.info("No changes to save")
+            else:
+                # One write for the whole batch; the store recalculates the averages
+                try:
+                    store.record_assessments(changes, read_version)
+                except WriteConflict as conflict:
+                    names = ", ".join(assigned_students.loc[conflict.student_ids, 'name'])
+                    st.error(f"Not saved: {names} changed while you were editing. The grid now shows the latest scores; review your edits and save again.")
+                else:
+                    st.session_state.show_success = True
+                    rerun_fragment()
@@ -0,0 +1,82 @@
+# pts/pages/student_details.py
+# Student Details: pick a student and see their scores and attendance
+
+import streamlit as st
+
+from pts.derived import display
+from pts.pages.common import fragment, rerun_fragment
+
+# Matches offered for a search
+SEARCH_RESULTS = 10
+
+
+def render(store):
+    st.header("👤 Individual Student Analysis")
+    _student(store)
+
+
+# Choosing a student and going back rerun only this section, not the app
+@fragment
+def _student(store):
+    if 'selected_student_id' not in st.session_state:
+        st.info("Search for a student to view detailed analysis")
+
+        # Only the closest matches go to the browser, not the whole roster;
+        # center, grade and ID tell apart students sharing a name
+        query = st.text_input("Search by name:", placeholder="Start typing a name...")
+        matches = store.search(query, limit=SEARCH_RESULTS) if query else None
+
+        if matches is not None and matches.empty:
+            st.warning("No students match that name")
+        elif matches is not None:
+            selected_id = st.selectbox(
+                "Select a student:", [None] + matches.index.tolist(),
+                format_func=lambda sid: "Choose a student..." if sid is None else
+                f"{matches.at[sid, 'name']} • {matches.at[sid, 'center']} • Grade {matches.at[sid, 'grade']} (#{sid})"
+            )
+
+            if selected_id is not None:
+                st.session_state.selected_student_id = selected_id
+
+    if 'selected_student_id' in st.session_state:
+        student = store.get(st.session_state.selected_student_id)
+
+        # Student Header
+        col1, col2 = st.columns([3, 1])
+
+        with col1:
+            st.markdown(f"## {student['name']}")
+            st.caption(f"Grade {student['grade']} • {student['center']}")
+
+        with col2:
+            if st.button("← Back"):
+                del st.session_state.selected_student_id
+                rerun_fragment()
+
+        # Performance Summary
+        st.subheader("📊 Performance Summary")
+
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Entry Score", display(student['entry_score'], '', '/30'))
+        with col2:
+            st.metric("Avg Attendance", display(student['attendance_avg']))
+        with col3:
+            st.metric("Mid-Year Avg", display(student['mid_year_avg']))
+        with col4:
+            st.metric("End-Year Avg", display(student['end_year_avg']))
+
+        # One chart per assessment period on record, from the long assessments table
+        history = store.assessments.pivot(student_ids=[st.session_state.selected_student_id]).iloc[0].dropna()
+        subject_scores = history.drop('Attendance', level='subject', errors='ignore')
+        periods = subject_scores.index.get_level_values('period').unique()
+
+        for start in range(0, len(periods), 2):
+            for col, period in zip(st.columns(2), periods[start:start + 2]):
+                with col:
+                    st.write(f"**Subject Performance - {period}**")
+                    st.bar_chart(subject_scores.xs(period, level='period').rename('Score'))
+
+        if len(periods) > 2:
+            st.write("**Score Trend**")
+            st.line_chart(subject_scores.unstack('subject').reindex(periods))
@@ -0,0 +1,123 @@
+# pts/profiling.py
+# Lightweight in-process timers and counters for finding slow reruns in production
+
+import json
+import math
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+import pandas as pd
+
+# Histogram buckets grow by 20% from 0.1 ms, so ~80 buckets reach past a minute
+# and any percentile is accurate to within one bucket
+_BASE_MS = 0.1
+_GROWTH = 1.2
+_BUCKETS = 80
+
+
+def _bucket(ms):
+    if ms <= _BASE_MS:
+        return 0
+    return min(_BUCKETS - 1, int(math.log(ms / _BASE_MS, _GROWTH)) + 1)
+
+
+def _upper_ms(bucket):
+    return _BASE_MS * _GROWTH ** bucket
+
+
+class Section:
+    """Fixed-size latency histogram for one named section."""
+
+    def __init__(self):
+        self.counts = [0] * _BUCKETS
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms):
+        self.counts[_bucket(ms)] += 1
+        self.calls += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, fraction):
+        target = fraction * self.calls
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= target and count:
+                return min(_upper_ms(bucket), self.max_ms)
+        return self.max_ms
+
+
+class Profiler:
+    """Named timers and counters shared by every session in the process.
+
+    ``with profiler.timed('page.Dashboard Overview'):`` records one sample;
+    ``profiler.count('store.write')`` bumps a counter. Timings go into
+    bucketed histograms, so memory stays constant however long the server
+    runs.
+    """
+
+    def __init__(self):
+        self._sections = {}
+        self._counters = Counter()
+        self._lock = threading.Lock()
+        self.started = time.time()
+
+    @contextmanager
+    def timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def record(self, name, ms):
+        with self._lock:
+            section = self._sections.get(name)
+            if section is None:
+                section = self._sections[name] = Section()
+            section.record(ms)
+
+    def count(self, name, n=1):
+        with self._lock:
+            self._counters[name] += n
+
+    def summary(self):
+        """One row per timed section: calls, mean, p50, p95 and max in ms; slowest p95 first."""
+        with self._lock:
+            rows = [{
+                'section': name,
+                'calls': section.calls,
+                'mean_ms': round(section.total_ms / section.calls, 1),
+                'p50_ms': round(section.percentile(0.5), 1),
+                'p95_ms': round(section.percentile(0.95), 1),
+                'max_ms': round(section.max_ms, 1)
+            } for name, section in self._sections.items()]
+        columns = ['section', 'calls', 'mean_ms', 'p50_ms', 'p95_ms', 'max_ms']
+        return pd.DataFrame(rows, columns=columns).sort_values('p95_ms', ascending=False, ignore_index=True)
+
+    def counters(self):
+        with self._lock:
+            return dict(self._counters)
+
+    def export_jsonl(self):
+        """The summary and counters as JSON lines, one record per section or counter."""
+        now = time.time()
+        lines = [json.dumps({'ts': now, 'type': 'timer', **row}) for row in self.summary().to_dict('records')]
+        lines += [json.dumps({'ts': now, 'type': 'counter', 'name': name, 'value': value})
+                  for name, value in self.counters().items()]
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        with self._lock:
+            self._sections.clear()
+            self._counters.clear()
+            self.started = time.time()
+
+
+# The process-wide profiler every module records into
+profiler = Profiler()
@@ -0,0 +1,152 @@
+# pts/reports.py
+# Report engine: one vectorized computation per report type, run on a worker
+# pool and cached by (report_type, grade_filter, data_version)
+
+import threading
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from pts import rules
+from pts.derived import display
+
+# metrics: label -> display value; tables: subheader -> DataFrame
+Report = namedtuple('Report', ['title', 'metrics', 'tables'])
+
+GRADE_FILTERS = {"All Grades": None, "Grade 9": 9, "Grade 10": 10}
+
+
+def performance_summary(data, progress):
+    growth = data['end_year_avg'] - data['mid_year_avg']
+    progress(0.5, "Ranking students")
+    table = pd.DataFrame({
+        'Name': data['name'],
+        'Grade': data['grade'],
+        'Mid-Year Avg': data['mid_year_avg'].round(1),
+        'End-Year Avg': data['end_year_avg'].round(1),
+        'Growth': growth.round(1)
+    }).sort_values('End-Year Avg', ascending=False)
+    return Report("Student Performance Summary", {
+        "Total Students": len(data),
+        "Mid-Year Avg": display(data['mid_year_avg'].mean()),
+        "End-Year Avg": display(data['end_year_avg'].mean()),
+        "Avg Growth": display(growth.mean(), '+.1f', ' pts')
+    }, {"Students by End-Year Average": table})
+
+
+def attendance_analysis(data, progress):
+    bands = pd.cut(
+        data['attendance_avg'], [0, 75, 85, 90, 95, 100],
+        labels=['Below 75%', '75-85%', '85-90%', '90-95%', '95-100%'], include_lowest=True
+    )
+    band_counts = bands.value_counts(sort=False).rename_axis('Attendance Band').reset_index(name='Students')
+    progress(0.5, "Finding students below 90%")
+    below = data[data['attendance_avg'] < 90]
+    return Report("Attendance Analysis", {
+        "Avg Attendance": display(data['attendance_avg'].mean()),
+        "Below 90%": len(below),
+        "Below 85%": int((data['attendance_avg'] < 85).sum())
+    }, {
+        "Attendance Bands": band_counts,
+        "Students Below 90%": below[['name', 'grade', 'attendance_mid', 'attendance_end', 'attendance_avg']]
+        .sort_values('attendance_avg')
+    })
+
+
+def scholarship_status(data, progress):
+    counts = data['scholarship_status'].value_counts()
+    progress(0.5, "Breaking down by grade")
+    by_grade = pd.crosstab(data['scholarship_status'], data['grade'], margins=True, margins_name='Total')
+    by_grade.columns = [c if c == 'Total' else f"Grade {c}" for c in by_grade.columns]
+    return Report("Scholarship Status Report", {
+        status: int(counts.get(status, 0)) for status in ['Active', 'Under Review', 'Discontinued']
+    }, {"Status by Grade": by_grade})
+
+
+def continuation_report(data, progress):
+    grade_9 = data[data['grade'] == 9]
+    recommendation = rules.classify(grade_9)
+    progress(0.5, "Summarising decisions")
+    decision = grade_9['continuation_approved'].astype('string').fillna('Pending Decision')
+    table = pd.DataFrame({
+        'Name': grade_9['name'],
+        'End-Year Avg': grade_9['end_year_avg'].round(1),
+        'End-Year Attendance': grade_9['attendance_end'],
+        'Recommendation': recommendation,
+        'Decision': decision
+    })
+    return Report("Grade 9 Continuation Report", {
+        "Grade 9 Students": len(grade_9),
+        "Recommended": int((recommendation == 'Recommended').sum()),
+        "Pending Decision": int((decision == 'Pending Decision').sum())
+    }, {
+        "Decisions": decision.value_counts().rename_axis('Decision').reset_index(name='Students'),
+        "Grade 9 Students": table
+    })
+
+
+REPORTS = {
+    "Student Performance Summary": performance_summary,
+    "Attendance Analysis": attendance_analysis,
+    "Scholarship Status Report": scholarship_status,
+    "Grade 9 Continuation Report": continuation_report
+}
+
+
+class Job:
+    """A report being built (or already built); pages poll ``progress`` and ``done()``."""
+
+    def __init__(self):
+        self.fraction = 0.0
+        self.text = "Queued"
+        self.future = None
+
+    def progress(self, fraction, text):
+        self.fraction, self.text = fraction, text
+
+    def done(self):
+        return self.future.done()
+
+    def result(self):
+        return self.future.result()
+
+
+class ReportEngine:
+    """Builds reports on a thread pool and shares the results between sessions.
+
+    Two users asking for the same report at the same data version get the
+    same ``Job``; a finished report is served from cache until the data
+    changes. pandas releases the GIL for most of the work, so threads are
+    enough and avoid pickling the table to a process pool.
+    """
+
+    def __init__(self, max_workers=4, cache_size=32):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='report')
+        self._jobs = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+
+    def submit(self, store, report_type, grade_filter):
+        key = (report_type, grade_filter, store.version)
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None:
+                self._jobs.move_to_end(key)
+                return job
+
+            grade = GRADE_FILTERS[grade_filter]
+            data = store.frame() if grade is None else store.select(grade=grade)
+            job = Job()
+            job.future = self._pool.submit(self._run, REPORTS[report_type], data, job)
+            self._jobs[key] = job
+            while len(self._jobs) > self._cache_size:
+                self._jobs.popitem(last=False)
+            return job
+
+    @staticmethod
+    def _run(report, data, job):
+        job.progress(0.1, "Computing")
+        result = report(data, job.progress)
+        job.progress(1.0, "Done")
+        return result
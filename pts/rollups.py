@@ -0,0 +1,107 @@
+# pts/rollups.py
+# Group aggregates kept current from row deltas instead of re-aggregating the table
+
+import pandas as pd
+
+
+class Rollup:
+    """Per-group sums and means, maintained incrementally from store writes.
+
+    ``inputs`` maps a slice of the student table to the group keys plus one
+    column per measure; ``measures`` says whether each is summed or averaged.
+    The store calls ``rebuild()`` once on load and ``apply()`` with the old and
+    new versions of the rows each write touched, so a write costs O(rows
+    touched + groups) however large the table is.
+    """
+
+    def __init__(self, keys, measures, inputs):
+        self.keys = keys
+        self.measures = measures
+        self.inputs = inputs
+        self.version = 0
+        self._totals = None
+        self._table = None
+
+    def _contributions(self, rows):
+        inputs = self.inputs(rows)
+        parts = {'_rows': pd.Series(1.0, index=inputs.index)}
+        for name, how in self.measures.items():
+            values = inputs[name].astype(float)
+            if how == 'mean':
+                parts[f'{name}_sum'] = values.fillna(0)
+                parts[f'{name}_n'] = values.notna().astype(float)
+            else:
+                parts[name] = values.fillna(0)
+        frame = pd.concat([inputs[self.keys], pd.DataFrame(parts)], axis=1)
+        return frame.groupby(self.keys, observed=True).sum()
+
+    def rebuild(self, data):
+        self._totals = self._contributions(data)
+        self.version += 1
+
+    def apply(self, before, after):
+        if before is not None and len(before):
+            self._totals = self._totals.add(-self._contributions(before), fill_value=0)
+        if after is not None and len(after):
+            self._totals = self._totals.add(self._contributions(after), fill_value=0)
+        self.version += 1
+
+    def table(self):
+        """The finished aggregates, one row per non-empty group."""
+        if self._table is None or self._table[0] != self.version:
+            totals = self._totals[self._totals['_rows'] > 0]
+            finished = pd.DataFrame(index=totals.index)
+            for name, how in self.measures.items():
+                if how == 'mean':
+                    finished[name] = totals[f'{name}_sum'] / totals[f'{name}_n'].where(totals[f'{name}_n'] > 0)
+                else:
+                    finished[name] = totals[name].round().astype(int)
+            self._table = (self.version, finished)
+        return self._table[1]
+
+
+# Admin "Multi-Center Overview" comparison table
+def _center_inputs(rows):
+    return pd.DataFrame({
+        'center': rows['center'],
+        'total_students': 1,
+        'avg_attendance': rows['attendance_avg'],
+        'scholarships': rows['scholarship_status'] == 'Active',
+        'avg_score': rows['entry_score']
+    }, index=rows.index)
+
+
+def center_summary():
+    return Rollup(
+        ['center'],
+        {'total_students': 'sum', 'avg_attendance': 'mean', 'scholarships': 'sum', 'avg_score': 'mean'},
+        _center_inputs
+    )
+
+
+# Coordinator grade-wise breakdown, per center
+def _grade_inputs(rows):
+    return pd.DataFrame({
+        'center': rows['center'],
+        'grade': rows['grade'],
+        'attendance_avg': rows['attendance_avg'],
+        'entry_score': rows['entry_score'],
+        'count': 1
+    }, index=rows.index)
+
+
+def grade_summary():
+    return Rollup(
+        ['center', 'grade'],
+        {'attendance_avg': 'mean', 'entry_score': 'mean', 'count': 'sum'},
+        _grade_inputs
+    )
+
+
+# Students per scholarship status, for Live Analytics
+def _status_inputs(rows):
+    return pd.DataFrame({'scholarship_status': rows['scholarship_status'], 'students': 1}, index=rows.index)
+
+
+def status_summary():
+    return Rollup(['scholarship_status'], {'students': 'sum'}, _status_inputs)
@@ -0,0 +1,48 @@
+# pts/rules.py
+# Grade 9 -> Grade 10 continuation rules, evaluated over the whole queue at once
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# A student meets a rule when every column is at or above its minimum
+Rule = namedtuple('Rule', ['label', 'minimums'])
+
+# Checked in order; the first rule a student meets sets their recommendation
+CONTINUATION_RULES = [
+    Rule('Recommended', {'end_year_avg': 75, 'attendance_end': 90}),
+    Rule('Conditional', {'end_year_avg': 70, 'attendance_end': 85})
+]
+DEFAULT_RECOMMENDATION = 'At Risk'
+RECOMMENDATIONS = [rule.label for rule in CONTINUATION_RULES] + [DEFAULT_RECOMMENDATION]
+
+# Admin decision -> (continuation_approved, scholarship_status) written to the store
+DECISIONS = {
+    'Approve': ('Approved', 'Active'),
+    'Reject': ('Rejected', 'Discontinued'),
+    'Hold': ('On Hold', 'Under Review')
+}
+
+
+def classify(data, rules=CONTINUATION_RULES, default=DEFAULT_RECOMMENDATION):
+    """Recommendation for every row of ``data`` in one vectorized pass.
+
+    Missing scores never meet a minimum, so students without end-year
+    results fall through to ``default``.
+    """
+    conditions = [
+        np.logical_and.reduce([data[column].to_numpy(dtype=float, na_value=np.nan) >= minimum for column, minimum in rule.minimums.items()])
+        for rule in rules
+    ]
+    labels = np.select(conditions, [rule.label for rule in rules], default=default)
+    return pd.Series(labels, index=data.index, dtype=object, name='recommendation')
+
+
+def decide(student_ids, decision):
+    """The ``update_many`` batch that records ``decision`` for ``student_ids``."""
+    approved, status = DECISIONS[decision]
+    return pd.DataFrame(
+        {'continuation_approved': approved, 'scholarship_status': status},
+        index=pd.Index(student_ids, name='student_id')
+    )
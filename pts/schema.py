@@ -0,0 +1,68 @@
+# pts/schema.py
+# Compact column types for the student table, and a report of what it costs in RAM
+
+import pandas as pd
+
+SCORE_COLUMNS = [
+    'mid_year_math', 'mid_year_english', 'mid_year_science',
+    'end_year_math', 'end_year_english', 'end_year_science'
+]
+ATTENDANCE_COLUMNS = ['attendance_mid', 'attendance_end']
+
+# Low-cardinality strings are categoricals (one small code per row); 0-100
+# values fit in a byte. Scores, attendance and age use the nullable UInt8 so a
+# student can exist before their results are entered.
+SCHEMA = {
+    'name': 'string',
+    'grade': 'uint8',
+    'age': 'UInt8',
+    'center': 'category',
+    'scholarship_status': 'category',
+    'entry_score': 'UInt8',
+    **{column: 'UInt8' for column in SCORE_COLUMNS + ATTENDANCE_COLUMNS},
+    'continuation_approved': 'category',
+    'teacher_assigned': 'category',
+    'attendance_avg': 'float32',
+    'mid_year_avg': 'float32',
+    'end_year_avg': 'float32'
+}
+
+
+def apply(data):
+    """Cast the columns of ``data`` covered by ``SCHEMA`` to their compact types."""
+    return data.astype({column: dtype for column, dtype in SCHEMA.items() if column in data})
+
+
+def check(data):
+    """Raise ``TypeError`` if ``data`` holds a value its compact type cannot, such as 24.5 or 300 in a UInt8 column."""
+    # Categoricals take any value, so only the fixed-width types are tried
+    data.astype({column: dtype for column, dtype in SCHEMA.items() if column in data and dtype != 'category'})
+
+
+def with_categories(series, values):
+    """``series`` with any new values from ``values`` added to its categories."""
+    new = pd.Index(pd.unique(pd.Series(values, dtype=object).dropna())).difference(series.cat.categories)
+    return series.cat.add_categories(new) if len(new) else series
+
+
+def coerce(values, dtype):
+    """``values`` as an array of ``dtype``, ready to assign into a column of that type."""
+    if isinstance(dtype, pd.CategoricalDtype):
+        return pd.Categorical(values, dtype=dtype)
+    return pd.Series(values).astype(dtype).array
+
+
+def memory_report(data):
+    """Bytes held by each column of ``data``, largest first, with a total row."""
+    usage = data.memory_usage(deep=True)
+    report = pd.DataFrame({
+        'Column': usage.index,
+        'Type': [str(data.index.dtype) if column == 'Index' else str(data[column].dtype) for column in usage.index],
+        'Bytes': usage.to_numpy()
+    }).sort_values('Bytes', ascending=False)
+    report['Bytes / Student'] = (report['Bytes'] / max(len(data), 1)).round(2)
+    total = pd.DataFrame([{
+        'Column': 'Total', 'Type': '', 'Bytes': usage.sum(),
+        'Bytes / Student': round(usage.sum() / max(len(data), 1), 2)
+    }])
+    return pd.concat([report, total], ignore_index=True)
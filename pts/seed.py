@@ -0,0 +1,26 @@
+# pts/seed.py
+# Demo cohort used to seed an empty student store
+
+import pandas as pd
+
+
+def demo_students():
+    """Return the five demo students the platform ships with."""
+    return pd.DataFrame({
+        'name': ['Ananya Chakraborty', 'Rahul Mondal', 'Priya Das', 'Amit Kumar', 'Sneha Roy'],
+        'grade': [9, 10, 9, 10, 9],
+        'age': [14, 15, 14, 15, 14],
+        'center': ['Saltlake Center'] * 5,
+        'scholarship_status': ['Active', 'Active', 'Active', 'Under Review', 'Active'],
+        'entry_score': [24, 23, 26, 21, 25],
+        'mid_year_math': [82, 78, 88, 75, 80],
+        'mid_year_english': [75, 70, 83, 72, 78],
+        'mid_year_science': [80, 74, 87, 79, 82],
+        'end_year_math': [85, 80, 90, 78, 83],
+        'end_year_english': [78, 72, 85, 75, 80],
+        'end_year_science': [82, 76, 88, 80, 85],
+        'attendance_mid': [94, 91, 96, 88, 92],
+        'attendance_end': [95, 93, 97, 85, 94],
+        'continuation_approved': [None, 'Approved', None, 'Pending', None],
+        'teacher_assigned': ['Teacher A', 'Teacher B', 'Teacher A', 'Teacher C', 'Teacher A']
+    })
@@ -0,0 +1,745 @@
+# pts/store.py
+# Student store: a SQLite snapshot plus an append-only journal, shared by every process on the host
+
+import json
+import os
+import sqlite3
+import threading
+from concurrent.futures import Future
+from contextlib import closing, contextmanager
+from queue import Queue
+
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:
+    # No flock (Windows): the store still works, but only one process may open it
+    fcntl = None
+
+from pts import assessments, derived, schema, views
+from pts.indexes import HashIndex, NameIndex
+from pts.profiling import profiler
+from pts.rollups import center_summary, grade_summary, status_summary
+from pts.seed import demo_students
+
+# Columns persisted to disk; the averages in pts.derived are rebuilt on load
+COLUMNS = [
+    'name', 'grade', 'age', 'center', 'scholarship_status', 'entry_score',
+    'mid_year_math', 'mid_year_english', 'mid_year_science',
+    'end_year_math', 'end_year_english', 'end_year_science',
+    'attendance_mid', 'attendance_end',
+    'continuation_approved', 'teacher_assigned'
+]
+
+# Domain values offered by the forms and accepted by bulk import
+CENTERS = ['Saltlake Center', 'Park Street Center', 'Howrah Center', 'New Town Center']
+TEACHERS = ['Teacher A', 'Teacher B', 'Teacher C']
+GRADES = [9, 10]
+SCHOLARSHIP_STATUSES = ['Active', 'Under Review', 'Discontinued']
+
+# Columns with a maintained hash index, for ids() / select() lookups
+INDEXED_COLUMNS = ['name', 'teacher_assigned', 'center', 'grade', 'continuation_approved']
+
+# New rows wait in the append buffer until a read needs them or it reaches this size
+APPEND_BUFFER_LIMIT = 256
+
+# The journal is folded into the snapshot once it grows past this many bytes,
+# which bounds how much a restart has to replay
+CHECKPOINT_BYTES = 4 * 1024 * 1024
+
+# Most queued writes the committer applies before syncing the journal once for all of them
+COMMIT_BATCH_LIMIT = 64
+
+
+def default_path():
+    """``students.sqlite3`` under ``$PTS_DATA_DIR`` (``data/`` by default)."""
+    return os.path.join(os.environ.get('PTS_DATA_DIR', 'data'), 'students.sqlite3')
+
+
+def _records(data):
+    # [student_id, *COLUMNS] lists; sqlite3 and json only take plain Python
+    # values, so box numpy scalars and map NaN to None
+    rows = data[COLUMNS].astype(object)
+    rows = rows.where(data[COLUMNS].notna(), None)
+    return [[int(sid), *values] for sid, values in zip(rows.index, rows.itertuples(index=False, name=None))]
+
+
+class WriteConflict(Exception):
+    """Some rows a write touches were changed by another writer after the caller read them."""
+
+    def __init__(self, student_ids):
+        super().__init__(f"Students changed since they were read: {student_ids}")
+        self.student_ids = student_ids
+
+
+class StudentStore:
+    """The student table, held once per process and made durable on disk.
+
+    Pages read with ``frame()`` and must treat the result as read-only; every
+    change goes through ``update()``/``update_many()`` or ``add()``/``add_many()``
+    so it reaches disk and every other session.
+
+    Scores also live in ``assessments``, a long-format table covering any
+    period and subject; the student table's score columns are its view of
+    the two current periods.
+
+    Each change is appended to a JSON lines journal next to the SQLite file.
+    The SQLite file is a snapshot that records the last journal event it
+    includes; ``checkpoint()`` folds the journal into it, and a restart loads
+    the snapshot and replays only the journal tail.
+
+    Single inserts land in an append buffer and are compacted into the table
+    in one concat when it is next read, rather than copying the table per row.
+
+    Writes are queued to a single committer thread, which applies them in
+    order and syncs the journal once per batch. A commit builds a new table
+    and swaps it in, so a frame a page is holding never changes underneath
+    it and reads never wait for a write. The new table is a shallow copy of
+    the current one: under pandas 3 Copy-on-Write (``requirements.txt`` pins
+    ``pandas>=3``) assigning into it never writes to blocks it shares with
+    earlier frames.
+
+    Each row remembers the ``version`` that last wrote it; a write passed the
+    ``read_version`` its data was drawn from raises ``WriteConflict`` if any
+    of its rows have been written since.
+
+    Several server processes on one host can open the same file. The
+    journal is then the change feed between them: ``version`` is the
+    sequence number of the last journal event applied, commits take an
+    exclusive lock on ``<name>.lock`` and first apply what other processes
+    appended, and ``refresh()`` (one ``stat`` when nothing changed) pulls
+    those events in for readers. Remote events go through the same
+    row-delta path as local writes, so caches and views invalidate only
+    where rows changed and nothing is reloaded. A checkpoint moves the
+    journal aside rather than truncating it, and a process that missed a
+    whole journal catches up from the rows stamped with a newer ``version``
+    in the WAL-mode SQLite snapshot.
+    """
+
+    def __init__(self, path=None, seed=demo_students):
+        self.path = path or default_path()
+        self.journal_path = os.path.splitext(self.path)[0] + '.journal'
+        self.lock_path = os.path.splitext(self.path)[0] + '.lock'
+        self._seed = seed
+        self.version = 0
+        self._lock = threading.RLock()
+        self._seq = 0
+        self._unsaved = {}
+        self._unsaved_scores = {}
+        self._undo = []
+        self.assessments = assessments.AssessmentTable()
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._lock_file = open(self.lock_path, 'a+b')
+        self._pending = []
+        self._row_versions = {}
+        with self._exclusive():
+            self._open_journal()
+            self._data = self._load()
+        self.version = self._seq
+        self._next_id = int(self._data.index.max()) + 1 if len(self._data) else 1
+        self._indexes = {column: HashIndex(column) for column in INDEXED_COLUMNS}
+        for column, index in self._indexes.items():
+            index.build(self._data[column])
+
+        self._queue = Queue()
+        threading.Thread(target=self._commit_loop, name='pts-store-commit', daemon=True).start()
+
+        # Aggregates and other derived state that follow every write; each
+        # listener has rebuild(data) and apply(before, after)
+        self._listeners = []
+        self.rollups = {
+            'center': center_summary(),
+            'center_grade': grade_summary(),
+            'status': status_summary()
+        }
+        for rollup in self.rollups.values():
+            self.subscribe(rollup)
+
+        # Mirrors the student table's score columns into the long table
+        self.subscribe(self.assessments)
+
+        # Name search for the student pickers
+        self.names = NameIndex()
+        self.subscribe(self.names)
+
+        # Cached per-teacher / per-center / queue slices, opened on first use
+        self.views = {}
+
+    def subscribe(self, listener):
+        """Keep ``listener`` in step with the table: built now, then fed each write's row deltas."""
+        self._submit(self._subscribe, listener)
+
+    def _subscribe(self, listener):
+        listener.rebuild(self.frame())
+        self._listeners.append(listener)
+
+    def _notify(self, before, after):
+        for listener in self._listeners:
+            listener.apply(before, after)
+
+    def _connect(self):
+        return closing(sqlite3.connect(self.path))
+
+    @contextmanager
+    def _exclusive(self):
+        # Held while loading and while committing, across every process using the file
+        if fcntl is not None:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    def _open_journal(self):
+        # Binary, so offsets are byte counts comparable with the file size
+        self._journal = open(self.journal_path, 'a+b')
+        self._journal_id = os.fstat(self._journal.fileno()).st_ino
+        self._offset = 0
+
+    def _load(self):
+        with self._connect() as conn, conn:
+            # WAL lets a process load the snapshot while another one checkpoints into it
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS students "
+                f"(student_id INTEGER PRIMARY KEY, {', '.join(COLUMNS)}, version INTEGER NOT NULL DEFAULT 0)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS assessments "
+                "(student_id INTEGER, period TEXT, subject TEXT, score INTEGER, version INTEGER NOT NULL DEFAULT 0, "
+                "PRIMARY KEY (student_id, period, subject))"
+            )
+            # Files written before rows carried the journal event that last wrote them
+            for table in ['students', 'assessments']:
+                if 'version' not in [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value)")
+            data = pd.read_sql_query(
+                f"SELECT student_id, {', '.join(COLUMNS)} FROM students ORDER BY student_id",
+                conn, index_col='student_id'
+            )
+            # A cleared score is kept as a NULL row so other processes can see it went
+            scores = pd.read_sql_query(
+                f"SELECT {', '.join(assessments.LONG_COLUMNS)} FROM assessments WHERE score IS NOT NULL", conn
+            )
+            meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+        self._seq = meta.get('journal_seq', 0)
+        # Periods are kept in the order they were first recorded
+        self._register_periods(meta)
+
+        # Cold start on an empty file: seed it (with the demo cohort by default)
+        if data.empty:
+            data = self._seed()
+            data.index = pd.RangeIndex(1, len(data) + 1, name='student_id')
+            self._snapshot([(0, record) for record in _records(data)])
+
+        # Changes made after the snapshot was taken, newest version of each row
+        for event in self._tail():
+            self._remember(event)
+        if self._unsaved:
+            tail = pd.DataFrame(
+                [record[1:] for _, record in self._unsaved.values()],
+                index=pd.Index(list(self._unsaved), name='student_id'), columns=COLUMNS
+            )
+            data = pd.concat([data.drop(tail.index, errors='ignore'), tail]).sort_index()
+        if self._unsaved_scores:
+            tail = pd.DataFrame([record for _, record in self._unsaved_scores.values()], columns=assessments.LONG_COLUMNS)
+            scores = pd.concat([scores, tail], ignore_index=True)
+        self.assessments.record(scores)
+        if self._offset:
+            self._checkpoint()
+
+        return schema.apply(derived.rebuild(data))
+
+    def _register_periods(self, meta):
+        for period in json.loads(meta.get('assessment_periods', '[]')):
+            if period not in self.assessments.periods:
+                self.assessments.periods.append(period)
+
+    def _tail(self):
+        # Journal events after self._seq, up to the last complete line
+        self._journal.seek(self._offset)
+        # Called under the lock, so no other process is mid-append
+        for line in self._journal:
+            if not line.endswith(b'\n'):
+                break
+            event = json.loads(line)
+            self._offset += len(line)
+            if event['seq'] > self._seq:
+                self._seq = event['seq']
+                yield event
+        # Anything past the last complete line is an append cut short by a
+        # crash; it was never acknowledged, and later appends must not join it
+        if os.fstat(self._journal.fileno()).st_size > self._offset:
+            self._journal.truncate(self._offset)
+        self._journal.seek(0, os.SEEK_END)
+
+    def _remember(self, event, undo=None):
+        # Rows changed since the last checkpoint, for the next one to write;
+        # ``undo`` collects the entries replaced, should the write be rolled back
+        unsaved = self._unsaved_scores if event['op'] == 'assess' else self._unsaved
+        for record in event['rows']:
+            key = tuple(record[:3]) if event['op'] == 'assess' else record[0]
+            if undo is not None:
+                undo.append((unsaved, key, unsaved.get(key)))
+            unsaved[key] = (event['seq'], record)
+
+    def _append(self, op, records):
+        # One JSON line per change, replayable on its own; _sync() makes it durable
+        self._seq += 1
+        event = {'seq': self._seq, 'op': op, 'rows': records}
+        line = (json.dumps(event) + '\n').encode()
+        self._journal.write(line)
+        self._offset += len(line)
+        self._remember(event, self._undo)
+
+    def _rollback(self, mark):
+        # Take back the journal lines a failed write appended, before the batch
+        # is synced, so a write its caller saw fail never becomes durable
+        offset, seq, undone = mark
+        if self._offset != offset:
+            self._journal.truncate(offset)
+            self._journal.seek(0, os.SEEK_END)
+            self._offset, self._seq = offset, seq
+        while len(self._undo) > undone:
+            unsaved, key, previous = self._undo.pop()
+            if previous is None:
+                del unsaved[key]
+            else:
+                unsaved[key] = previous
+
+    def _log(self, op, data):
+        self._append(op, _records(data))
+
+    def _log_scores(self, rows):
+        self._append('assess', assessments.records(rows))
+
+    def _sync(self):
+        with profiler.timed('store.journal_sync'):
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+        if self._offset >= CHECKPOINT_BYTES:
+            self._checkpoint()
+
+    def _snapshot(self, records, scores=()):
+        # (version, record) pairs and the journal position they bring the snapshot up to, in one transaction
+        placeholders = ', '.join('?' * (len(COLUMNS) + 2))
+        with profiler.timed('store.snapshot'), self._connect() as conn, conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO students (student_id, {', '.join(COLUMNS)}, version) "
+                f"VALUES ({placeholders})",
+                [(*record, version) for version, record in records]
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO assessments (student_id, period, subject, score, version) VALUES (?, ?, ?, ?, ?)",
+                [(*record, version) for version, record in scores]
+            )
+            conn.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", [
+                ('journal_seq', self._seq),
+                ('assessment_periods', json.dumps(self.assessments.periods))
+            ])
+
+    def checkpoint(self):
+        """Write the rows changed since the last checkpoint into the snapshot and start a new journal."""
+        self._submit(self._checkpoint)
+
+    def _checkpoint(self):
+        self._snapshot(list(self._unsaved.values()), list(self._unsaved_scores.values()))
+        self._unsaved = {}
+        self._unsaved_scores = {}
+        # Replaced rather than truncated: a process still reading the old
+        # journal finishes it from its open handle, then moves to the new one
+        fresh = self.journal_path + '.new'
+        open(fresh, 'wb').close()
+        os.replace(fresh, self.journal_path)
+        self._journal.close()
+        self._open_journal()
+
+    # Changes from other processes
+
+    def refresh(self):
+        """Apply what other processes have committed since this one last looked.
+
+        Cheap when nothing changed: one ``stat`` of the journal. Pages call it
+        at the start of each run; writes do the same under the commit lock.
+        """
+        try:
+            current = os.stat(self.journal_path)
+        except FileNotFoundError:
+            return
+        if current.st_ino != self._journal_id or current.st_size != self._offset:
+            with profiler.timed('store.refresh'):
+                self._submit(self._catch_up)
+
+    def _catch_up(self):
+        # On the committer, holding the lock: drain this journal; if it has
+        # been replaced, fill any gap from the snapshot and follow the new one
+        while True:
+            for event in self._tail():
+                self._apply_remote(event)
+            if os.stat(self.journal_path).st_ino == self._journal_id:
+                return
+            self._journal.close()
+            self._open_journal()
+            self._unsaved = {}
+            self._unsaved_scores = {}
+            self._catch_up_from_snapshot()
+
+    def _catch_up_from_snapshot(self):
+        # Only rows stamped after our last event, never the whole table
+        with self._connect() as conn:
+            meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+            if meta.get('journal_seq', 0) <= self._seq:
+                return
+            rows = conn.execute(
+                f"SELECT student_id, {', '.join(COLUMNS)} FROM students WHERE version > ?", (self._seq,)
+            ).fetchall()
+            scores = conn.execute(
+                f"SELECT {', '.join(assessments.LONG_COLUMNS)} FROM assessments WHERE version > ?", (self._seq,)
+            ).fetchall()
+        self._register_periods(meta)
+        # Rows are stamped with the snapshot's position, which may be later than
+        # the event that wrote them; a stale read_version is refused, never missed
+        self._seq = meta['journal_seq']
+        if rows:
+            self._apply_rows([list(row) for row in rows])
+        if scores:
+            self._apply_scores([list(row) for row in scores])
+
+    def _apply_remote(self, event):
+        self._remember(event)
+        if event['op'] == 'assess':
+            self._apply_scores(event['rows'])
+        else:
+            self._apply_rows(event['rows'])
+
+    def _apply_rows(self, records):
+        batch = pd.DataFrame(
+            [record[1:] for record in records],
+            index=pd.Index([record[0] for record in records], name='student_id'), columns=COLUMNS
+        )
+        self._compact()
+        known = batch.index.isin(self._data.index)
+        if known.any():
+            self._install(batch[known], *self._changed(batch[known]))
+        if not known.all():
+            self._next_id = max(self._next_id, int(batch.index.max()) + 1)
+            self._insert(batch[~known])
+
+    def _apply_scores(self, records):
+        rows = pd.DataFrame(records, columns=assessments.LONG_COLUMNS)
+        self.assessments.record(rows)
+        self._committed(rows['student_id'].unique().tolist(), None, None)
+
+    # Commit pipeline
+
+    def _submit(self, apply, *args):
+        # Queue a write for the committer and wait until it is durable
+        future = Future()
+        self._queue.put((future, apply, args))
+        return future.result()
+
+    def _commit_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < COMMIT_BATCH_LIMIT and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            applied = []
+            with self._exclusive():
+                # Other processes' commits first, so versions and ids follow theirs
+                try:
+                    self._catch_up()
+                except Exception as error:
+                    for future, _, _ in batch:
+                        future.set_exception(error)
+                    continue
+                self._undo = []
+                for future, apply, args in batch:
+                    mark = (self._offset, self._seq, len(self._undo))
+                    try:
+                        applied.append((future, apply(*args)))
+                    except Exception as error:
+                        self._rollback(mark)
+                        future.set_exception(error)
+                if not applied:
+                    continue
+                # One sync for the writes that succeeded, before any of their writers is told they committed
+                try:
+                    self._sync()
+                except Exception as error:
+                    for future, _ in applied:
+                        future.set_exception(error)
+                    continue
+            for future, result in applied:
+                future.set_result(result)
+
+    # Reads
+
+    def frame(self):
+        """The full student table, indexed by ``student_id``.
+
+        Later writes replace the table rather than change it, so the frame
+        returned stays as it was; read ``version`` first to know how current
+        it is.
+        """
+        self._compact()
+        return self._data
+
+    def get(self, student_id):
+        """One student's row as a dict."""
+        self._compact()
+        return self._data.loc[student_id].to_dict()
+
+    def ids(self, **criteria):
+        """Sorted ``student_id``s whose indexed columns equal all of ``criteria``.
+
+        ``store.ids(grade=9, continuation_approved=None)`` intersects the two
+        index buckets instead of scanning the table; ``None`` matches missing
+        values.
+        """
+        matches = None
+        for column, value in criteria.items():
+            bucket = self._indexes[column].get(value)
+            matches = set(bucket) if matches is None else matches & bucket
+            if not matches:
+                return []
+        return sorted(self.frame().index if matches is None else matches)
+
+    def rows(self, student_ids, columns=None):
+        """The table rows for ``student_ids``, in the order given; only ``columns`` if given."""
+        self._compact()
+        if columns is None:
+            return self._data.loc[student_ids]
+        return self._data.loc[student_ids, columns]
+
+    def select(self, **criteria):
+        """Rows matching ``criteria``; see ``ids()``."""
+        return self.rows(self.ids(**criteria))
+
+    def search(self, query, limit=10):
+        """Rows of the ``limit`` students whose name best matches ``query``, best first.
+
+        Typed prefixes (``"pri d"`` finds Priya Das) are answered from
+        ``NameIndex`` without touching the table; misspellings fall back to
+        trigram matches.
+        """
+        with profiler.timed('store.search'):
+            return self.rows(self.names.search(query, limit))
+
+    def memory_report(self):
+        """Per-column RAM used by the student table; see ``schema.memory_report``."""
+        return schema.memory_report(self.frame())
+
+    def rollup(self, name):
+        """A maintained aggregate table from ``self.rollups``, e.g. ``rollup('center')``."""
+        return self.rollups[name].table()
+
+    def view(self, kind, *args):
+        """A cached slice from ``pts.views``, e.g. ``view('teacher', 'Teacher A')``."""
+        key = (kind, *args)
+        view = self.views.get(key)
+        if view is None:
+            view = self._submit(self._open_view, key)
+        return view.result(self)
+
+    def _open_view(self, key):
+        # On the committer, so a view is created and subscribed exactly once
+        if key not in self.views:
+            view = views.VIEWS[key[0]](*key[1:])
+            self._subscribe(view)
+            self.views[key] = view
+        return self.views[key]
+
+    # Writes
+
+    def _check_writable(self, values):
+        computed = set(values).intersection(derived.DERIVED_COLUMNS)
+        if computed:
+            raise ValueError(f"Derived columns cannot be written directly: {sorted(computed)}")
+
+    def _compact(self):
+        # Fold buffered inserts into the table with a single concat
+        if not self._pending:
+            return
+        with self._lock:
+            if not self._pending:
+                return
+            with profiler.timed('store.compact'):
+                data, rows = self._conform(self._data, pd.concat(self._pending))
+                self._data = pd.concat([data, rows])
+            self._pending = []
+
+    def _conform(self, data, batch):
+        # Give new rows the table's compact types (adding any new categories
+        # to a copy of the table first) so concatenating them keeps those types
+        data = data.copy(deep=False)
+        for column, dtype in data.dtypes.items():
+            if isinstance(dtype, pd.CategoricalDtype):
+                data[column] = schema.with_categories(data[column], batch[column])
+        return data, batch.astype(data.dtypes.to_dict())
+
+    def _assign(self, data, student_ids, column, values):
+        if isinstance(data[column].dtype, pd.CategoricalDtype):
+            data[column] = schema.with_categories(data[column], values)
+        data.loc[student_ids, column] = schema.coerce(values, data[column].dtype)
+
+    def _committed(self, student_ids, before, after):
+        # Stamp the rows with the journal event just written (or applied) and let listeners follow the delta
+        self.version = self._seq
+        self._row_versions.update(dict.fromkeys(student_ids, self.version))
+        self._notify(before, after)
+
+    def update(self, student_id, values, read_version=None):
+        """Set ``values`` (a column -> value dict) on one student."""
+        self.update_many(pd.DataFrame([values], index=[student_id]), read_version)
+
+    def update_many(self, changes, read_version=None):
+        """Write a batch of edits in one step.
+
+        ``changes`` is a DataFrame indexed by ``student_id`` whose columns are
+        the stored columns to set. Indexes, derived averages and the journal
+        are updated for the touched rows only. With ``read_version`` (the
+        ``version`` the caller's data was read at) nothing is written and
+        ``WriteConflict`` is raised if another write has touched any of the
+        rows since.
+        """
+        self._check_writable(changes.columns)
+        profiler.count('store.rows_updated', len(changes))
+        with profiler.timed('store.update_many'):
+            self._submit(self._update, changes, read_version)
+
+    def _check_versions(self, student_ids, read_version):
+        if read_version is not None:
+            stale = [sid for sid in student_ids if self._row_versions.get(sid, 0) > read_version]
+            if stale:
+                raise WriteConflict(stale)
+
+    def _update(self, changes, read_version):
+        self._check_versions(changes.index.tolist(), read_version)
+        data, before, after = self._changed(changes)
+        self._log('update', after)
+        self._install(changes, data, before, after)
+
+    def _changed(self, changes):
+        # A new table with ``changes`` applied, and the touched rows before and after
+        student_ids = changes.index.tolist()
+        self._compact()
+        data = self._data.copy(deep=False)
+        before = data.loc[student_ids]
+        for column in changes.columns:
+            self._assign(data, student_ids, column, changes[column].to_numpy())
+        derived.refresh(data, student_ids, changes.columns)
+        return data, before, data.loc[student_ids]
+
+    def _install(self, changes, data, before, after):
+        # Swap the new table in before the indexes point at it
+        student_ids = changes.index.tolist()
+        self._data = data
+        for column in changes.columns.intersection(list(self._indexes)):
+            index = self._indexes[column]
+            for student_id, old, new in zip(student_ids, before[column], changes[column]):
+                index.move(student_id, old, new)
+        self._committed(student_ids, before, after)
+
+    def record_assessments(self, rows, read_version=None):
+        """Upsert long-format scores: a DataFrame of ``student_id``, ``period``, ``subject``, ``score``.
+
+        An NA ``score`` clears that entry. Scores for a (period, subject) that
+        has a student-table column (``assessments.WIDE_COLUMNS``) are written
+        to that column, so averages, rollups and views follow them; the rest
+        go to the long table only. ``read_version`` is as for ``update_many()``.
+        A score that is not a whole number from 0 to 100 raises ``ValueError``
+        and nothing is written.
+        """
+        profiler.count('store.scores_recorded', len(rows))
+        with profiler.timed('store.record_assessments'):
+            self._submit(self._record_assessments, rows[assessments.LONG_COLUMNS], read_version)
+
+    def _record_assessments(self, rows, read_version):
+        # Every score is checked before any of the batch is journaled
+        assessments.check(rows)
+        self._check_versions(rows['student_id'].unique().tolist(), read_version)
+        column = assessments.wide_column(rows)
+        wide = rows[column.notna()]
+        if len(wide):
+            self._update(self._wide_changes(wide, column[column.notna()]), None)
+        extra = rows[column.isna()]
+        if len(extra):
+            self._log_scores(extra)
+            self.assessments.record(extra)
+            self._committed(extra['student_id'].unique().tolist(), None, None)
+
+    def _wide_changes(self, rows, columns):
+        # One student x column frame for update_many(), so the whole grid is a
+        # single write; cells the batch does not set keep their current value
+        cells = rows.assign(column=columns).drop_duplicates(['student_id', 'column'], keep='last')
+        student_ids = pd.Index(cells['student_id'].unique())
+        names = pd.Index(cells['column'].unique())
+        self._compact()
+        values = self._data.loc[student_ids, names].to_numpy(dtype='float64', na_value=np.nan)
+        at = student_ids.get_indexer(cells['student_id']), names.get_indexer(cells['column'])
+        values[at] = cells['score'].to_numpy(dtype='float64', na_value=np.nan)
+        return pd.DataFrame(values, index=student_ids.tolist(), columns=names.tolist())
+
+    def add(self, record):
+        """Insert a new student and return the ``student_id`` assigned to it.
+
+        Assessment columns left out of ``record`` stay empty until entered. A
+        value its column cannot hold raises ``TypeError`` and nothing is written.
+        """
+        self._check_writable(record)
+        with profiler.timed('store.add'):
+            return self._submit(self._add, record)
+
+    def _add(self, record):
+        student_id = self._next_id
+        row = pd.DataFrame([record], index=pd.Index([student_id], name='student_id'), columns=COLUMNS)
+        row = derived.rebuild(row)
+        # Before it is journaled: a value the table cannot hold is refused here,
+        # rather than failing every later read and every restart
+        schema.check(row)
+        self._log('add', row)
+        self._next_id += 1
+        with self._lock:
+            self._pending.append(row)
+        for column, index in self._indexes.items():
+            index.add(student_id, record.get(column))
+        self._committed([student_id], None, row)
+        if len(self._pending) >= APPEND_BUFFER_LIMIT:
+            self._compact()
+        return student_id
+
+    def add_many(self, records):
+        """Insert a DataFrame of new students in one batch; returns their ``student_id``s.
+
+        All or nothing: one value its column cannot hold raises ``TypeError``.
+        """
+        self._check_writable(records.columns)
+        profiler.count('store.rows_added', len(records))
+        with profiler.timed('store.add_many'):
+            return self._submit(self._add_many, records)
+
+    def _add_many(self, records):
+        self._compact()
+        ids = pd.RangeIndex(self._next_id, self._next_id + len(records), name='student_id')
+        # Typed before it is journaled, as in _add()
+        data, rows = self._conform(self._data, derived.rebuild(records.reindex(columns=COLUMNS).set_axis(ids)))
+        self._log('add', rows)
+        self._next_id += len(records)
+        self._place(data, rows)
+        return list(ids)
+
+    def _insert(self, batch):
+        self._compact()
+        self._place(*self._conform(self._data, derived.rebuild(batch)))
+
+    def _place(self, data, rows):
+        # Swap in ``data`` with ``rows`` (already conformed to it) appended
+        self._data = pd.concat([data, rows])
+        for column, index in self._indexes.items():
+            for student_id, value in zip(rows.index, rows[column]):
+                index.add(student_id, value)
+        self._committed(rows.index, None, rows)
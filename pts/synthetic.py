@@ -0,0 +1,86 @@
+# pts/synthetic.py
+# Synthetic student cohorts for load testing and benchmarks
+
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from pts.store import CENTERS, COLUMNS, TEACHERS, StudentStore, default_path
+
+FIRST_NAMES = [
+    'Ananya', 'Rahul', 'Priya', 'Amit', 'Sneha', 'Arjun', 'Riya', 'Sourav', 'Ishita', 'Debjit',
+    'Tanya', 'Arnab', 'Moumita', 'Rohan', 'Payel', 'Subham', 'Ankita', 'Sayan', 'Puja', 'Kunal'
+]
+LAST_NAMES = [
+    'Chakraborty', 'Mondal', 'Das', 'Kumar', 'Roy', 'Banerjee', 'Ghosh', 'Sen', 'Bose', 'Dutta',
+    'Mukherjee', 'Saha', 'Paul', 'Sarkar', 'Biswas'
+]
+
+# Share of students at each center, largest first
+CENTER_WEIGHTS = [0.35, 0.25, 0.25, 0.15]
+
+
+def _scores(rng, ability, mean, spread):
+    return np.clip(np.rint(rng.normal(mean + 6 * ability, spread)), 0, 100)
+
+
+def generate(n, seed=0):
+    """``n`` students with the store's columns and plausible, correlated values.
+
+    Entry score drives an ability term that lifts every subject; end-year
+    scores track mid-year ones with a small average gain, and attendance is
+    high with a long low tail.
+    """
+    rng = np.random.default_rng(seed)
+    grade = rng.choice([9, 10], n, p=[0.55, 0.45])
+    entry_score = np.clip(np.rint(rng.normal(24, 3, n)), 0, 30)
+    ability = (entry_score - 24) / 3 + rng.normal(0, 0.7, n)
+
+    data = pd.DataFrame({
+        'name': pd.Series(rng.choice(FIRST_NAMES, n)) + ' ' + pd.Series(rng.choice(LAST_NAMES, n)),
+        'grade': grade,
+        'age': grade + 5 + rng.choice([0, 1], n, p=[0.8, 0.2]),
+        'center': rng.choice(CENTERS, n, p=CENTER_WEIGHTS),
+        'scholarship_status': rng.choice(['Active', 'Under Review', 'Discontinued'], n, p=[0.82, 0.13, 0.05]),
+        'entry_score': entry_score,
+        'teacher_assigned': rng.choice(TEACHERS, n)
+    })
+    for subject in ['math', 'english', 'science']:
+        mid = _scores(rng, ability, 76, 9)
+        data[f'mid_year_{subject}'] = mid
+        data[f'end_year_{subject}'] = np.clip(mid + np.rint(rng.normal(2, 5, n)), 0, 100)
+    attendance_mid = np.clip(np.rint(100 - rng.gamma(2, 4, n)), 40, 100)
+    data['attendance_mid'] = attendance_mid
+    data['attendance_end'] = np.clip(attendance_mid + np.rint(rng.normal(0, 3, n)), 40, 100)
+
+    # Grade 9 students are mostly awaiting a continuation decision; grade 10 already continued
+    decided = rng.choice(['Approved', 'On Hold', 'Rejected'], n, p=[0.85, 0.1, 0.05])
+    pending = rng.random(n) < 0.7
+    data['continuation_approved'] = np.where(grade == 10, 'N/A', np.where(pending, None, decided))
+    return data[COLUMNS]
+
+
+def build_store(n, path=None, seed=0):
+    """Create a store file at ``path`` holding ``n`` synthetic students (replacing any file there)."""
+    path = path or default_path()
+    stem = os.path.splitext(path)[0]
+    for stale in (path, path + '-wal', path + '-shm', stem + '.journal', stem + '.lock'):
+        if os.path.exists(stale):
+            os.remove(stale)
+    return StudentStore(path, seed=lambda: generate(n, seed))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic student store")
+    parser.add_argument('--students', type=int, default=10_000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--path', default=None, help="SQLite file (default: $PTS_DATA_DIR/students.sqlite3)")
+    args = parser.parse_args()
+    store = build_store(args.students, args.path, args.seed)
+    print(f"Wrote {len(store.frame()):,} students to {store.path}")
+
+
+if __name__ == '__main__':
+    main()
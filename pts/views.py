@@ -0,0 +1,93 @@
+# pts/views.py
+# Named slices of the student table that stay cached until a write touches their rows
+
+from collections import namedtuple
+
+from pts import rules
+
+# Coordinators follow up on students whose average attendance is below this
+AT_RISK_ATTENDANCE = 90
+
+TeacherView = namedtuple('TeacherView', ['students', 'avg_attendance', 'active_scholarships'])
+CenterView = namedtuple('CenterView', ['students', 'at_risk'])
+ApprovalQueue = namedtuple('ApprovalQueue', ['students', 'recommendation', 'counts'])
+
+
+class View:
+    """The rows matching ``criteria`` and what ``derive`` computes from them.
+
+    ``criteria`` are indexed-column equalities, as for ``StudentStore.select``.
+    The store feeds every write to ``apply()``; only a write whose old or new
+    rows match ``criteria`` invalidates the view, so a rerun with no relevant
+    change returns the cached result without filtering or aggregating.
+    """
+
+    def __init__(self, criteria, derive):
+        self.criteria = criteria
+        self.derive = derive
+        self.version = 0
+        self._result = None
+
+    def _touches(self, rows):
+        if rows is None or not len(rows):
+            return False
+        match = True
+        for column, value in self.criteria.items():
+            match = match & (rows[column].isna() if value is None else rows[column] == value)
+        return bool(match.any())
+
+    def rebuild(self, data):
+        self.version += 1
+
+    def apply(self, before, after):
+        if self._touches(before) or self._touches(after):
+            self.version += 1
+
+    def result(self, store):
+        """The cached result, recomputed first if a write has touched the view."""
+        if self._result is None or self._result[0] != self.version:
+            # Tagged with the version it started from, so a write landing
+            # mid-computation leaves it stale rather than cached
+            version = self.version
+            self._result = (version, self.derive(store.select(**self.criteria)))
+        return self._result[1]
+
+
+# Teacher dashboard and Data Entry
+def _teacher(students):
+    return TeacherView(
+        students,
+        students['attendance_avg'].mean(),
+        int((students['scholarship_status'] == 'Active').sum())
+    )
+
+
+def teacher_view(teacher):
+    return View({'teacher_assigned': teacher}, _teacher)
+
+
+# Coordinator dashboard and the admin's per-center drill-down
+def _center(students):
+    return CenterView(students, students[students['attendance_avg'] < AT_RISK_ATTENDANCE])
+
+
+def center_view(center):
+    return View({'center': center}, _center)
+
+
+# Grade 9 students still waiting for a continuation decision
+def _approval_queue(students):
+    recommendation = rules.classify(students)
+    return ApprovalQueue(students, recommendation, recommendation.value_counts())
+
+
+def approval_queue():
+    return View({'grade': 9, 'continuation_approved': None}, _approval_queue)
+
+
+# store.view(kind, *args) -> factory(*args)
+VIEWS = {
+    'teacher': teacher_view,
+    'center': center_view,
+    'approval_queue': approval_queue
+}
@@ -0,0 +1,121 @@
+# tests/test_assessments.py
+# The long-format scores table: packed keys, upserts, pivots and summaries
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pts.assessments import LONG_COLUMNS, AssessmentTable
+from pts.store import StudentStore
+from pts.synthetic import generate
+
+
+def long(*rows):
+    return pd.DataFrame(list(rows), columns=LONG_COLUMNS)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return StudentStore(str(tmp_path / 'students.sqlite3'), seed=lambda: generate(10))
+
+
+@pytest.mark.parametrize('score', [300, 101, -1, 85.7])
+def test_scores_that_do_not_fit_are_refused(store, score):
+    version = store.version
+    with pytest.raises(ValueError):
+        store.record_assessments(long([1, 'Quarter 1', 'Math', 80], [2, 'Quarter 1', 'Math', score]))
+    assert store.version == version
+    assert 'Quarter 1' not in store.assessments.pivot().columns.get_level_values('period')
+    with pytest.raises(ValueError):
+        AssessmentTable().record(long([1, 'Quarter 1', 'Math', score]))
+
+
+def test_grid_save_is_one_write(store):
+    version = store.version
+    store.record_assessments(long(
+        [1, 'Mid-Year', 'Math', 51], [2, 'Mid-Year', 'English', 62],
+        [1, 'Mid-Year', 'Math', 55], [3, 'End-Year', 'Science', None]
+    ))
+    assert store.version == version + 1
+    frame = store.frame()
+    assert frame.at[1, 'mid_year_math'] == 55
+    assert frame.at[2, 'mid_year_english'] == 62
+    assert pd.isna(frame.at[3, 'end_year_science'])
+    # Cells the save did not set are left alone
+    assert frame.at[1, 'mid_year_english'] == generate(10).at[0, 'mid_year_english']
+
+
+def test_grid_save_is_all_or_nothing(store):
+    before = store.frame()
+    with pytest.raises(ValueError):
+        store.record_assessments(long([1, 'Mid-Year', 'Math', 51], [2, 'Mid-Year', 'English', 300]))
+    assert store.frame().at[1, 'mid_year_math'] == before.at[1, 'mid_year_math']
+
+
+def test_upsert_and_delete():
+    table = AssessmentTable()
+    table.record(long([7, 'Quarter 1', 'Math', 60], [7, 'Quarter 1', 'Art', 70], [3, 'Quarter 1', 'Math', 80]))
+    table.record(long(
+        [7, 'Quarter 1', 'Math', 65],      # update
+        [7, 'Quarter 1', 'Art', None],     # NA deletes
+        [3, 'Quarter 2', 'Math', 81],      # insert
+        [9, 'Quarter 1', 'Math', None],    # deleting nothing is a no-op
+        [3, 'Quarter 2', 'Math', 82]       # last row in a batch wins
+    ))
+    assert len(table) == 3
+    assert table.frame().astype({'period': str, 'subject': str}).values.tolist() == [
+        [3, 'Quarter 1', 'Math', 80], [3, 'Quarter 2', 'Math', 82], [7, 'Quarter 1', 'Math', 65]
+    ]
+    # Periods keep the order they were first recorded in, after the student table's
+    assert table.periods == ['Mid-Year', 'End-Year', 'Quarter 1', 'Quarter 2']
+
+
+def test_matches_a_plain_dict_of_scores():
+    rng = np.random.default_rng(1)
+    table, expected = AssessmentTable(), {}
+    periods, subjects = ['Mid-Year', 'Quarter 1', 'Quarter 2'], ['Math', 'Art', 'Attendance']
+    for _ in range(20):
+        n = 200
+        rows = long(*zip(
+            # Large ids check the student bits of the packed key
+            rng.integers(1, 60, n) * 1_000_003,
+            rng.choice(periods, n), rng.choice(subjects, n),
+            np.where(rng.random(n) < 0.2, np.nan, rng.integers(0, 101, n))
+        ))
+        table.record(rows)
+        for sid, period, subject, score in rows.itertuples(index=False):
+            if np.isnan(score):
+                expected.pop((sid, period, subject), None)
+            else:
+                expected[sid, period, subject] = score
+
+    frame = table.frame().astype({'period': str, 'subject': str})
+    assert {(sid, p, s): score for sid, p, s, score in frame.itertuples(index=False)} == expected
+
+    # Pivots follow the requested order, with empty rows for students without scores
+    student_ids = [59 * 1_000_003, 5, 2 * 1_000_003, 59 * 1_000_003, 1_000_003]
+    pivot = table.pivot(student_ids=student_ids)
+    assert pivot.index.tolist() == student_ids
+    assert pivot.loc[5].isna().all()
+    for sid, period, subject in [(sid, p, s) for sid in student_ids for p in periods for s in subjects]:
+        value = pivot.iloc[student_ids.index(sid)].get((period, subject), np.nan)
+        assert (np.isnan(value) and (sid, period, subject) not in expected) or value == expected[sid, period, subject]
+    quarter = table.pivot('Quarter 1', student_ids=student_ids[:3])
+    assert quarter.index.tolist() == student_ids[:3]
+    assert quarter.equals(pivot.xs('Quarter 1', axis=1, level='period').iloc[:3].reindex(columns=quarter.columns))
+
+    # summary() agrees with a groupby of the same rows
+    summary = table.summary()
+    reference = frame.groupby(['period', 'subject'])['score'].agg(['size', 'mean'])
+    for (period, subject), row in reference.iterrows():
+        assert summary.loc[(period, subject), 'students'] == row['size']
+        assert summary.loc[(period, subject), 'mean'] == pytest.approx(row['mean'])
+    assert summary['students'].sum() == len(expected)
+
+
+def test_summary_follows_writes():
+    table = AssessmentTable()
+    table.record(long([1, 'Quarter 1', 'Math', 60], [2, 'Quarter 1', 'Math', 80]))
+    assert table.summary().loc[('Quarter 1', 'Math'), 'mean'] == 70
+    table.record(long([2, 'Quarter 1', 'Math', None]))
+    assert table.summary().loc[('Quarter 1', 'Math')].tolist() == [1, 60]
@@ -0,0 +1,86 @@
+# tests/test_cohort.py
+# The one-pass cohort analytics agree with the plain pandas way of computing them
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pts import cohort
+from pts.store import StudentStore
+from pts.synthetic import generate
+
+
+@pytest.fixture
+def data(tmp_path):
+    data = StudentStore(str(tmp_path / 'students.sqlite3'), seed=lambda: generate(600)).frame().copy()
+    rng = np.random.default_rng(3)
+    for column in ['mid_year_avg', 'end_year_avg', 'attendance_avg']:
+        data.loc[rng.random(len(data)) < 0.15, column] = np.nan
+    data.loc[rng.random(len(data)) < 0.1, 'entry_score'] = pd.NA
+    # A center/grade group with no scores at all, a center with no students,
+    # and a grade with a single student
+    no_scores = (data['center'] == data['center'].iloc[0]) & (data['grade'] == data['grade'].iloc[0])
+    data.loc[no_scores, ['mid_year_avg', 'end_year_avg']] = np.nan
+    data['center'] = data['center'].cat.add_categories(['Empty Center'])
+    data.loc[data.index[-1], 'grade'] = 12
+    return data
+
+
+def test_percentile_ranks_match_groupby_rank(data):
+    values = cohort.latest_average(data)
+    expected = values.groupby([data['center'], data['grade']], observed=True).rank(pct=True) * 100
+    ranks = cohort.percentile_ranks(data, values)
+    pd.testing.assert_series_equal(ranks, expected.rename('percentile'))
+    assert ranks.isna().sum() == values.isna().sum() > 0
+
+
+def test_percentile_ranks_of_empty_and_missing():
+    data = pd.DataFrame({'center': pd.Categorical([], categories=['A']), 'grade': np.array([], dtype='uint8')})
+    assert cohort.percentile_ranks(data, pd.Series([], dtype='float64')).empty
+    data = pd.DataFrame({'center': ['A', 'A', 'B'], 'grade': [9, 9, 9]})
+    ranks = cohort.percentile_ranks(data, pd.Series([np.nan, np.nan, 50.0]))
+    assert ranks.isna().tolist() == [True, True, False]
+    assert ranks[2] == 100
+
+
+# Series.corr warns on the single-student grade before returning NaN
+@pytest.mark.filterwarnings('ignore::RuntimeWarning')
+def test_correlations_match_series_corr(data):
+    overall = cohort.growth(data)['Overall']
+    table = cohort.correlations(data, overall)
+    outcomes = {
+        'Mid-Year Avg': data['mid_year_avg'], 'End-Year Avg': data['end_year_avg'],
+        'Growth': overall, 'Attendance': data['attendance_avg']
+    }
+    entry = data['entry_score'].astype('float64')
+    cohorts = {f"Grade {grade}": data['grade'] == grade for grade in sorted(data['grade'].unique())}
+    cohorts['All Grades'] = pd.Series(True, index=data.index)
+    assert table.index.tolist() == list(cohorts)
+    for name, rows in cohorts.items():
+        for outcome, values in outcomes.items():
+            expected = entry[rows].corr(values[rows].astype('float64'))
+            assert table.loc[name, outcome] == pytest.approx(expected, nan_ok=True, rel=1e-6)
+    # The single student in grade 12 has no correlation
+    assert table.loc['Grade 12'].isna().all()
+
+
+def test_risk_scores_match_a_per_student_weighted_mean(data):
+    percentile = cohort.percentile_ranks(data, cohort.latest_average(data))
+    overall = cohort.growth(data)['Overall']
+    scores = cohort.risk_scores(data, percentile, overall)
+
+    for sid in data.index:
+        row = data.loc[sid]
+        factors = {
+            'attendance': min(max((100 - row['attendance_avg']) / cohort.RISK_FULL_ATTENDANCE_GAP, 0), 1),
+            'achievement': 1 - percentile[sid] / 100,
+            'decline': min(max(-overall[sid] / cohort.RISK_FULL_DECLINE, 0), 1),
+            'entry': 1 - row['entry_score'] / cohort.ENTRY_SCORE_MAX if pd.notna(row['entry_score']) else np.nan
+        }
+        known = {name: value for name, value in factors.items() if not np.isnan(value)}
+        if not known:
+            assert np.isnan(scores[sid])
+            continue
+        weight = sum(cohort.RISK_WEIGHTS[name] for name in known)
+        expected = 100 * sum(cohort.RISK_WEIGHTS[name] * value for name, value in known.items()) / weight
+        assert scores[sid] == pytest.approx(expected)
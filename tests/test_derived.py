@@ -0,0 +1,33 @@
+# tests/test_derived.py
+# Derived averages skip missing inputs, and pages show a missing average as MISSING
+
+import numpy as np
+import pandas as pd
+
+from pts import derived
+
+
+def test_rebuild_skips_missing_scores():
+    data = pd.DataFrame({
+        'attendance_mid': pd.array([90, None], dtype='UInt8'),
+        'attendance_end': pd.array([None, None], dtype='UInt8'),
+        'mid_year_math': pd.array([80, None], dtype='UInt8'),
+        'mid_year_english': pd.array([70, None], dtype='UInt8'),
+        'mid_year_science': pd.array([None, None], dtype='UInt8'),
+        'end_year_math': pd.array([None, None], dtype='UInt8'),
+        'end_year_english': pd.array([None, None], dtype='UInt8'),
+        'end_year_science': pd.array([None, None], dtype='UInt8')
+    })
+    data = derived.rebuild(data)
+    assert data['attendance_avg'].tolist()[0] == 90
+    assert data['mid_year_avg'].tolist()[0] == 75
+    assert data[['attendance_avg', 'mid_year_avg', 'end_year_avg']].iloc[1].isna().all()
+
+
+def test_display():
+    assert derived.display(82.345) == "82.3%"
+    assert derived.display(np.uint8(95), '') == "95%"
+    assert derived.display(25, '', '/30') == "25/30"
+    assert derived.display(-1.25, '+.1f', ' pts') == "-1.2 pts"
+    for missing in [np.nan, pd.NA, None]:
+        assert derived.display(missing) == derived.MISSING
@@ -0,0 +1,70 @@
+# tests/test_importer.py
+# Bulk import validation and the defaults it fills in
+
+import io
+
+import pandas as pd
+
+from pts import importer
+from pts.store import StudentStore
+from pts.synthetic import generate
+
+UPLOAD = """name,grade,center,teacher_assigned,scholarship_status,continuation_approved,age,entry_score
+Asha Roy,9,Saltlake Center,Teacher A,,,14,25
+Bikram Sen,10,Saltlake Center,Teacher B,,,15,22
+Chaitali Das,10,Howrah Center,Teacher C,Under Review,Approved,15,27
+Dev Paul,9,Saltlake Center,Teacher A,Expelled,,14,24
+,9,Saltlake Center,Teacher A,Active,,14,40
+"""
+
+
+def _validate(text, center=None):
+    return importer.validate(pd.read_csv(io.StringIO(text)), center)
+
+
+def test_blank_cells_get_defaults():
+    valid, errors = _validate(UPLOAD)
+    assert valid['name'].tolist() == ['Asha Roy', 'Bikram Sen', 'Chaitali Das']
+    assert valid['scholarship_status'].tolist() == ['Active', 'Active', 'Under Review']
+    assert pd.isna(valid.loc[0, 'continuation_approved'])
+    assert valid['continuation_approved'].tolist()[1:] == ['N/A', 'Approved']
+    assert errors['row'].tolist() == [5, 6]
+    assert errors.loc[0, 'problems'] == 'unknown scholarship_status'
+    assert errors.loc[1, 'problems'] == 'name is required; entry_score outside 0-30'
+
+
+def test_left_out_columns_get_defaults():
+    valid, errors = _validate("name,grade,center,teacher_assigned\nAsha Roy,9,Saltlake Center,Teacher A\nBikram Sen,10,Howrah Center,Teacher B\n")
+    assert errors.empty
+    assert valid['scholarship_status'].tolist() == ['Active', 'Active']
+    assert pd.isna(valid.loc[0, 'continuation_approved'])
+    assert valid.loc[1, 'continuation_approved'] == 'N/A'
+
+
+def test_center_pinned_for_coordinators():
+    valid, errors = _validate(UPLOAD, center='Saltlake Center')
+    assert valid['name'].tolist() == ['Asha Roy', 'Bikram Sen']
+    assert 'not in Saltlake Center' in errors.loc[errors['name'] == 'Chaitali Das', 'problems'].iloc[0]
+
+
+def test_template_round_trips():
+    valid, errors = _validate(importer.template())
+    assert valid.empty and errors.empty
+
+
+def test_fractions_are_rejected(tmp_path):
+    valid, errors = _validate(
+        "name,grade,center,teacher_assigned,age,entry_score,mid_year_math\n"
+        "Asha Roy,9,Saltlake Center,Teacher A,14,25,80.0\n"
+        "Bikram Sen,9,Saltlake Center,Teacher A,14.5,24.5,80\n"
+        "Chaitali Das,9.5,Saltlake Center,Teacher A,14,25,80\n"
+    )
+    assert valid['name'].tolist() == ['Asha Roy']
+    assert errors['problems'].tolist() == [
+        'age not a whole number; entry_score not a whole number',
+        'unknown grade'
+    ]
+    # What passes fits the store's whole-number columns
+    store = StudentStore(str(tmp_path / 'students.sqlite3'), seed=lambda: generate(5))
+    ids = store.add_many(valid)
+    assert store.get(ids[0])['mid_year_math'] == 80
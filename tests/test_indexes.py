@@ -0,0 +1,81 @@
+# tests/test_indexes.py
+# Indexes kept current from write deltas agree with a scan of the table
+
+import numpy as np
+import pandas as pd
+
+from pts.indexes import HashIndex, NameIndex
+from pts.store import INDEXED_COLUMNS, StudentStore
+from pts.synthetic import generate
+
+NEW_STUDENT = {
+    'name': 'Test Student', 'grade': 9, 'age': 14, 'center': 'Saltlake Center',
+    'scholarship_status': 'Active', 'entry_score': 25, 'teacher_assigned': 'Teacher A'
+}
+
+
+def _scan(data, column):
+    # value -> student_ids, by a full scan; missing values under None
+    scanned = {}
+    for student_id, value in data[column].items():
+        scanned.setdefault(None if pd.isna(value) else value, set()).add(student_id)
+    return scanned
+
+
+def test_move_between_values_and_missing():
+    index = HashIndex('continuation_approved')
+    index.build(pd.Series(['Approved', None, 'Approved'], index=[1, 2, 3]))
+    index.move(1, 'Approved', None)
+    index.move(2, np.nan, 'On Hold')
+    index.move(3, 'Approved', 'Approved')
+    assert index.get(None) == {1}
+    assert index.get(np.nan) == {1}
+    assert index.get('On Hold') == {2}
+    assert index.get('Approved') == {3}
+    index.move(3, 'Approved', 'On Hold')
+    assert index.get('Approved') == set()
+    assert 'Approved' not in index._ids
+
+
+def test_store_indexes_match_a_scan_after_writes(tmp_path):
+    store = StudentStore(str(tmp_path / 'students.sqlite3'), seed=lambda: generate(300))
+    rng = np.random.default_rng(3)
+    for _ in range(10):
+        student_ids = sorted(rng.choice(store.frame().index, 25, replace=False).tolist())
+        store.update_many(pd.DataFrame({
+            'teacher_assigned': rng.choice(['Teacher A', 'Teacher B', 'Teacher Z'], 25),
+            'center': rng.choice(['Howrah Center', 'Saltlake Center'], 25),
+            'grade': rng.choice([9, 10], 25),
+            'continuation_approved': rng.choice(['Approved', 'On Hold', None], 25)
+        }, index=student_ids))
+        store.add({**NEW_STUDENT, 'center': 'Moved Center'})
+        store.add_many(pd.DataFrame([{**NEW_STUDENT, 'continuation_approved': None}] * 3))
+
+    data = store.frame()
+    for column in INDEXED_COLUMNS:
+        scanned = _scan(data, column)
+        assert {value: store.ids(**{column: value}) for value in scanned} == {
+            value: sorted(ids) for value, ids in scanned.items()
+        }
+        # No student is left behind under a value they no longer hold
+        assert set(store._indexes[column]._ids) == set(scanned)
+
+
+def test_name_index_follows_renames(tmp_path):
+    store = StudentStore(str(tmp_path / 'students.sqlite3'), seed=lambda: generate(300))
+    rng = np.random.default_rng(19)
+    names = ['Priya Das', 'Das Das', 'Rahul', 'Rahul Kumar Sen', 'Zeynep Ozturk', 'Priyanka Dasgupta']
+    for _ in range(10):
+        student_ids = sorted(rng.choice(store.frame().index, 20, replace=False).tolist())
+        store.update_many(pd.DataFrame({'name': rng.choice(names, 20)}, index=student_ids))
+        store.add({**NEW_STUDENT, 'name': str(rng.choice(names))})
+    renamed = store.ids(name='Zeynep Ozturk')[0]
+    store.update(renamed, {'name': 'Kavya Iyer'})
+
+    fresh = NameIndex()
+    fresh.rebuild(store.frame())
+    assert store.names._words == fresh._words
+    for query in ['das', 'pri d', 'rahul sen', 'zeynep', 'ozturk', 'kavya', 'dasgupt', 'priyanka dasgpta']:
+        assert store.names.search(query, limit=500) == fresh.search(query, limit=500)
+    assert renamed not in store.names.search('zeynep', limit=500)
+    assert store.names.search('kavya iyer') == [renamed]
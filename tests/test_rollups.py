@@ -0,0 +1,70 @@
+# tests/test_rollups.py
+# Rollups kept current from write deltas match a fresh groupby of the table
+
+import numpy as np
+import pandas as pd
+
+from pts.store import StudentStore
+from pts.synthetic import generate
+
+NEW_STUDENT = {
+    'name': 'Test Student', 'grade': 9, 'age': 14, 'center': 'Saltlake Center',
+    'scholarship_status': 'Active', 'entry_score': 25, 'teacher_assigned': 'Teacher A'
+}
+
+
+def _expected(data):
+    active = (data['scholarship_status'] == 'Active').astype(int)
+    by_grade = data.astype({'attendance_avg': 'float64', 'entry_score': 'float64'}).groupby(['center', 'grade'], observed=True)
+    return {
+        'center': pd.DataFrame({
+            'total_students': data.groupby('center', observed=True).size(),
+            'avg_attendance': data.groupby('center', observed=True)['attendance_avg'].mean().astype('float64'),
+            'scholarships': active.groupby(data['center'], observed=True).sum(),
+            'avg_score': data.groupby('center', observed=True)['entry_score'].mean().astype('float64')
+        }),
+        'center_grade': pd.DataFrame({
+            'attendance_avg': by_grade['attendance_avg'].mean(),
+            'entry_score': by_grade['entry_score'].mean(),
+            'count': by_grade.size()
+        }),
+        'status': data.groupby('scholarship_status', observed=True).size().to_frame('students')
+    }
+
+
+def _normal(table):
+    # Group keys as plain strings, so categorical and object indexes compare equal
+    keys = list(table.index.names)
+    table = table.reset_index()
+    table[keys] = table[keys].astype(str)
+    return table.set_index(keys).sort_index().astype('float64')
+
+
+def test_rollups_match_groupby_after_writes(tmp_path):
+    store = StudentStore(str(tmp_path / 'students.sqlite3'), seed=lambda: generate(300))
+    rng = np.random.default_rng(6)
+    centers = list(store.frame()['center'].cat.categories)
+    for _ in range(10):
+        student_ids = sorted(rng.choice(store.frame().index, 25, replace=False).tolist())
+        store.update_many(pd.DataFrame({
+            'center': rng.choice(centers, 25),
+            'grade': rng.choice([9, 10], 25),
+            'scholarship_status': rng.choice(['Active', 'Discontinued', 'Under Review'], 25),
+            'entry_score': rng.integers(0, 31, 25),
+            'attendance_mid': np.where(rng.random(25) < 0.3, None, rng.integers(50, 101, 25))
+        }, index=student_ids))
+        store.add({**NEW_STUDENT, 'center': 'Saltlake Center', 'grade': int(rng.choice([9, 10]))})
+        store.add_many(pd.DataFrame([{**NEW_STUDENT, 'entry_score': None}] * 3))
+
+    # Everyone leaves one center, so its group goes away
+    leaving = store.ids(center=centers[0])
+    store.update_many(pd.DataFrame({'center': centers[1]}, index=leaving))
+    # Attendance cleared for a whole center
+    clearing = store.ids(center='Saltlake Center')
+    store.update_many(pd.DataFrame({'attendance_mid': None, 'attendance_end': None}, index=clearing))
+
+    expected = _expected(store.frame())
+    assert centers[0] not in store.rollup('center').index
+    assert np.isnan(store.rollup('center').loc['Saltlake Center', 'avg_attendance'])
+    for name, table in expected.items():
+        pd.testing.assert_frame_equal(_normal(store.rollup(name)), _normal(table[store.rollup(name).columns]), rtol=1e-6)
@@ -0,0 +1,233 @@
+# tests/test_store.py
+# StudentStore durability and sharing: journal replay, snapshots, conflicts
+# and several store instances (standing in for server processes) on one file
+
+import os
+
+import pandas as pd
+import pytest
+
+from pts.store import StudentStore, WriteConflict
+from pts.synthetic import generate
+
+NEW_STUDENT = {
+    'name': 'Test Student', 'grade': 9, 'age': 14, 'center': 'Saltlake Center',
+    'scholarship_status': 'Active', 'entry_score': 25, 'teacher_assigned': 'Teacher A'
+}
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / 'students.sqlite3')
+
+
+def open_store(path):
+    return StudentStore(path, seed=lambda: generate(20))
+
+
+def math(store, student_id):
+    return store.get(student_id)['mid_year_math']
+
+
+# Restarts replay the journal after the snapshot
+
+def test_restart_replays_journal(path):
+    store = open_store(path)
+    store.update(1, {'mid_year_math': 55})
+    student_id = store.add(NEW_STUDENT)
+    assert os.path.getsize(store.journal_path) > 0
+
+    reopened = open_store(path)
+    assert math(reopened, 1) == 55
+    assert reopened.get(student_id)['name'] == 'Test Student'
+    assert reopened.version == store.version
+
+
+def test_restart_after_checkpoint(path):
+    store = open_store(path)
+    store.update(2, {'end_year_science': 91})
+    store.record_assessments(pd.DataFrame(
+        [[3, 'Quarter 1', 'Math', 64]], columns=['student_id', 'period', 'subject', 'score']
+    ))
+    store.checkpoint()
+    assert os.path.getsize(store.journal_path) == 0
+
+    reopened = open_store(path)
+    assert reopened.get(2)['end_year_science'] == 91
+    assert reopened.assessments.pivot('Quarter 1').loc[3, 'Math'] == 64
+    assert 'Quarter 1' in reopened.assessments.periods
+
+
+def test_torn_last_line_is_dropped(path):
+    store = open_store(path)
+    store.update(1, {'mid_year_math': 55})
+    with open(store.journal_path, 'ab') as journal:
+        journal.write(b'{"seq": 99, "op": "update", "rows": [[1, "Half')
+
+    reopened = open_store(path)
+    assert math(reopened, 1) == 55
+    assert reopened.version == store.version
+    # A write after the restart is not glued onto the torn line
+    reopened.update(1, {'mid_year_math': 66})
+    assert math(open_store(path), 1) == 66
+
+
+# Writes build new tables, and stale or failed writes leave no trace
+
+def test_frames_already_read_do_not_change(path):
+    store = open_store(path)
+    before = store.frame()
+    mid_year_avg = before.at[1, 'mid_year_avg']
+    store.update(1, {'mid_year_math': 0, 'mid_year_english': 0, 'mid_year_science': 0})
+
+    assert before.at[1, 'mid_year_math'] != 0
+    assert before.at[1, 'mid_year_avg'] == mid_year_avg
+    assert store.frame().at[1, 'mid_year_avg'] == 0
+
+
+def test_stale_read_version_is_refused(path):
+    store = open_store(path)
+    read_version = store.version
+    store.update(1, {'mid_year_math': 55})
+    with pytest.raises(WriteConflict) as conflict:
+        store.update_many(pd.DataFrame({'mid_year_math': [60, 61]}, index=[1, 2]), read_version)
+    assert conflict.value.student_ids == [1]
+    assert math(store, 1) == 55
+    # Rows nobody else touched still save at that version
+    store.update(2, {'mid_year_math': 61}, read_version)
+    assert math(store, 2) == 61
+
+
+def test_failed_add_is_not_journaled(path):
+    store = open_store(path)
+    version = store.version
+    with pytest.raises(TypeError):
+        store.add_many(pd.DataFrame([NEW_STUDENT, {**NEW_STUDENT, 'entry_score': 24.5}]))
+    with pytest.raises(TypeError):
+        store.add({**NEW_STUDENT, 'age': 300})
+    assert store.version == version
+    assert os.path.getsize(store.journal_path) == 0
+    assert len(store.frame()) == 20
+
+    # Later writes and restarts are unaffected, and ids are not skipped
+    assert store.add(NEW_STUDENT) == 21
+    assert open_store(path).get(21)['name'] == 'Test Student'
+
+
+def test_write_failing_after_journaling_is_rolled_back(path, monkeypatch):
+    store = open_store(path)
+    store.update(1, {'mid_year_math': 51})
+    size, version = os.path.getsize(store.journal_path), store.version
+
+    def fail(*args):
+        raise RuntimeError("install failed")
+    monkeypatch.setattr(store, '_install', fail)
+    with pytest.raises(RuntimeError):
+        store.update(1, {'mid_year_math': 52})
+    monkeypatch.undo()
+
+    assert os.path.getsize(store.journal_path) == size
+    store.update(2, {'mid_year_math': 62})
+    assert store.version == version + 1
+    reopened = open_store(path)
+    assert [math(reopened, 1), math(reopened, 2)] == [51, 62]
+
+
+# Several processes sharing one file
+
+def test_conflict_across_instances(path):
+    first, second = open_store(path), open_store(path)
+    read_version = second.version
+    first.update(1, {'mid_year_math': 55})
+
+    with pytest.raises(WriteConflict):
+        second.update(1, {'mid_year_math': 60}, read_version)
+    assert math(second, 1) == 55
+    assert math(first, 1) == 55
+    second.update(2, {'mid_year_math': 61}, read_version)
+    first.refresh()
+    assert math(first, 2) == 61
+
+
+def test_torn_line_from_another_process(path):
+    first, second = open_store(path), open_store(path)
+    # A third process crashed part-way through an append
+    with open(first.journal_path, 'ab') as journal:
+        journal.write(b'{"seq": 99, "op": "update", "rows": [[1, "Half')
+
+    first.update(1, {'mid_year_math': 55})
+    second.refresh()
+    assert math(second, 1) == 55
+    assert second.version == first.version
+
+
+def test_student_ids_are_unique_across_instances(path):
+    first, second = open_store(path), open_store(path)
+    ids = [
+        first.add(NEW_STUDENT),
+        second.add(NEW_STUDENT),
+        *first.add_many(pd.DataFrame([NEW_STUDENT] * 2)),
+        second.add(NEW_STUDENT)
+    ]
+    assert ids == list(range(21, 26))
+    first.refresh()
+    second.refresh()
+    assert first.frame().index.equals(second.frame().index)
+    assert open_store(path).frame().index.equals(first.frame().index)
+
+
+def test_refresh_is_a_no_op_when_nothing_changed(path):
+    first, second = open_store(path), open_store(path)
+    version = second.version
+    second.refresh()
+    assert second.version == version
+    first.update(1, {'mid_year_math': 55})
+    second.refresh()
+    assert second.version == first.version
+    assert math(second, 1) == 55
+
+
+def test_catch_up_after_one_checkpoint(path):
+    writer, lagging = open_store(path), open_store(path)
+    writer.update(1, {'mid_year_math': 51})
+    writer.checkpoint()
+    writer.update(2, {'mid_year_math': 52})
+
+    lagging.refresh()
+    assert [math(lagging, 1), math(lagging, 2)] == [51, 52]
+    assert lagging.version == writer.version
+
+
+def test_catch_up_after_two_checkpoints(path):
+    writer, lagging = open_store(path), open_store(path)
+    writer.update(1, {'mid_year_math': 51})
+    writer.checkpoint()
+    # Only in the journal that the next checkpoint replaces, which the lagging
+    # store never opens: it has to come from the snapshot
+    writer.update(2, {'mid_year_math': 52})
+    student_id = writer.add(NEW_STUDENT)
+    writer.checkpoint()
+    writer.update(3, {'mid_year_math': 53})
+
+    lagging.refresh()
+    assert [math(lagging, 1), math(lagging, 2), math(lagging, 3)] == [51, 52, 53]
+    assert lagging.get(student_id)['name'] == 'Test Student'
+    assert lagging.ids(name='Test Student') == [student_id]
+    assert lagging.version == writer.version
+    assert lagging.add(NEW_STUDENT) == student_id + 1
+
+
+def test_writes_catch_up_before_committing(path):
+    writer, lagging = open_store(path), open_store(path)
+    writer.update(1, {'mid_year_math': 51})
+    writer.checkpoint()
+    writer.update(1, {'mid_year_english': 71})
+    writer.checkpoint()
+
+    # No refresh first: the commit itself applies the other store's changes
+    lagging.update(1, {'mid_year_science': 81})
+    row = lagging.get(1)
+    assert [row['mid_year_math'], row['mid_year_english'], row['mid_year_science']] == [51, 71, 81]
+    assert row['mid_year_avg'] == pytest.approx((51 + 71 + 81) / 3)
+    writer.refresh()
+    assert writer.get(1)['mid_year_science'] == 81